@@ -1,10 +1,12 @@
 """Core SDOF vibration analysis modules."""
 
 from .sdof_system import SDOFSystem
-from .frequency_response import compute_frf
-from .transmissibility import compute_transmissibility
+from .sdof_array import SDOFSystemArray
+from .frequency_response import FrequencyGrid, compute_frf, compute_frf_batch, compute_frf_db
+from .transmissibility import compute_transmissibility, compute_transmissibility_db
 from .time_response import (
     compute_impulse_response,
+    compute_impulse_peak,
     compute_step_response,
     compute_harmonic_response,
     compute_free_vibration,
@@ -14,9 +16,15 @@ from .shock_response import compute_srs, compute_srs_from_pulse, generate_shock_
 
 __all__ = [
     "SDOFSystem",
+    "SDOFSystemArray",
+    "FrequencyGrid",
     "compute_frf",
+    "compute_frf_batch",
+    "compute_frf_db",
     "compute_transmissibility",
+    "compute_transmissibility_db",
     "compute_impulse_response",
+    "compute_impulse_peak",
     "compute_step_response",
     "compute_harmonic_response",
     "compute_free_vibration",
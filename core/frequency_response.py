@@ -1,14 +1,104 @@
 """Frequency Response Function (FRF) calculations for SDOF systems."""
 
+from __future__ import annotations
+
+from functools import lru_cache
+
 import numpy as np
 from typing import Tuple
 from .sdof_system import SDOFSystem
+from .sdof_array import SDOFSystemArray
+
+
+class FrequencyGrid:
+    """Frequency grid with cached angular-frequency terms.
+    
+    Build once and pass in place of a frequency array to evaluate several
+    systems (or an SRS) on the same grid without recomputing ω and ω² on
+    every call. The cached arrays are read-only.
+    
+    Attributes:
+        hz: Frequencies in Hz
+        omega: Angular frequencies ω in rad/s
+        omega2: Squared angular frequencies ω²
+    """
+    __slots__ = ("hz", "omega", "omega2")
+    
+    def __init__(self, frequencies: np.ndarray, freq_unit: str = "rad/s"):
+        """Create a grid from frequencies in "rad/s" or "hz"."""
+        frequencies = np.array(frequencies, dtype=float)
+        if freq_unit.lower() == "hz":
+            self.hz = frequencies
+            self.omega = 2 * np.pi * frequencies
+        else:
+            self.hz = frequencies / (2 * np.pi)
+            self.omega = frequencies
+        self.omega2 = self.omega * self.omega
+        
+        for arr in (self.hz, self.omega, self.omega2):
+            arr.flags.writeable = False
+    
+    def __len__(self) -> int:
+        return len(self.omega)
+
+
+def _angular_frequency(
+    frequencies: np.ndarray | FrequencyGrid,
+    freq_unit: str,
+    dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (ω, ω²) in the requested dtype for an array or FrequencyGrid."""
+    if isinstance(frequencies, FrequencyGrid):
+        return (
+            frequencies.omega.astype(dtype, copy=False),
+            frequencies.omega2.astype(dtype, copy=False)
+        )
+    
+    omega = np.asarray(frequencies, dtype=dtype)
+    if freq_unit.lower() == "hz":
+        omega = 2 * np.pi * omega
+    return omega, omega * omega
+
+
+def _dynamic_stiffness(
+    mass,
+    stiffness,
+    damping,
+    frequencies: np.ndarray | FrequencyGrid,
+    freq_unit: str,
+    dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (ω, Re D, Im D) of the dynamic stiffness D = (k - mω²) + jcω.
+    
+    The parameters may be scalars or arrays broadcasting against ω.
+    """
+    dtype = np.dtype(dtype)
+    omega, omega2 = _angular_frequency(frequencies, freq_unit, dtype)
+    
+    m = np.asarray(mass, dtype=dtype)
+    k = np.asarray(stiffness, dtype=dtype)
+    c = np.asarray(damping, dtype=dtype)
+    
+    return omega, k - m * omega2, c * omega
+
+
+def _inverse_polar(real: np.ndarray, imag: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return magnitude and phase (degrees) of 1/(real + j·imag).
+    
+    |1/D| = 1/|D| and ∠(1/D) = -∠D, so working on the parts of D avoids the
+    complex reciprocal.
+    """
+    magnitude = np.hypot(real, imag)
+    np.reciprocal(magnitude, out=magnitude)
+    phase = np.degrees(np.arctan2(-imag, real))
+    return magnitude, phase
 
 
 def compute_frf(
     system: SDOFSystem,
-    frequencies: np.ndarray,
-    freq_unit: str = "rad/s"
+    frequencies: np.ndarray | FrequencyGrid,
+    freq_unit: str = "rad/s",
+    dtype: np.dtype = np.float64
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Compute the frequency response function H(ω) for an SDOF system.
     
@@ -16,34 +106,94 @@ def compute_frf(
     
     Args:
         system: SDOFSystem instance
-        frequencies: Array of frequencies
-        freq_unit: "rad/s" or "hz"
+        frequencies: Array of frequencies or a FrequencyGrid
+        freq_unit: "rad/s" or "hz" (ignored for a FrequencyGrid)
+        dtype: Floating point type for the computation (np.float32 halves
+            memory traffic on long sweeps)
     
     Returns:
         Tuple of (frequencies in rad/s, magnitude, phase in degrees)
     """
-    if freq_unit.lower() == "hz":
-        omega = 2 * np.pi * frequencies
-    else:
-        omega = frequencies
-    
-    m = system.mass
-    k = system.stiffness
-    c = system.damping
+    omega, real, imag = _dynamic_stiffness(
+        system.mass, system.stiffness, system.damping, frequencies, freq_unit, dtype
+    )
+    magnitude, phase = _inverse_polar(real, imag)
+    return omega, magnitude, phase
+
+
+def compute_frf_batch(
+    systems: SDOFSystemArray,
+    frequencies: np.ndarray | FrequencyGrid,
+    freq_unit: str = "rad/s",
+    dtype: np.dtype = np.float64
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the FRF of many SDOF systems over a shared frequency grid.
     
-    # Complex FRF: H(ω) = 1 / ((k - mω²) + jcω)
-    denominator = (k - m * omega**2) + 1j * c * omega
-    H = 1.0 / denominator
+    Broadcasts H(ω) = 1/((k - mω²) + jcω) over systems (rows) and
+    frequencies (columns) in one vectorized evaluation.
     
-    magnitude = np.abs(H)
-    phase = np.angle(H, deg=True)
+    Args:
+        systems: SDOFSystemArray with S systems
+        frequencies: Array of F frequencies or a FrequencyGrid
+        freq_unit: "rad/s" or "hz" (ignored for a FrequencyGrid)
+        dtype: Floating point type for the computation (np.float32 halves
+            memory traffic on long sweeps)
     
+    Returns:
+        Tuple of (frequencies in rad/s, magnitude (S, F), phase in degrees (S, F))
+    """
+    omega, real, imag = _dynamic_stiffness(
+        systems.mass[:, None],
+        systems.stiffness[:, None],
+        systems.damping[:, None],
+        frequencies,
+        freq_unit,
+        dtype
+    )
+    magnitude, phase = _inverse_polar(real, imag)
     return omega, magnitude, phase
 
 
+def compute_frf_db(
+    system: SDOFSystem,
+    frequencies: np.ndarray | FrequencyGrid,
+    freq_unit: str = "rad/s",
+    dtype: np.dtype = np.float64
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the frequency response function with magnitude in dB.
+    
+    Equivalent to magnitude_to_db() applied to the compute_frf() magnitude,
+    but evaluates 20·log10|H| as -10·log10(|D|²), D = (k - mω²) + jcω, in
+    one buffer, skipping the square root and the linear magnitude array.
+    
+    Args:
+        system: SDOFSystem instance
+        frequencies: Array of frequencies or a FrequencyGrid
+        freq_unit: "rad/s" or "hz" (ignored for a FrequencyGrid)
+        dtype: Floating point type for the computation (np.float32 halves
+            memory traffic on long sweeps)
+    
+    Returns:
+        Tuple of (frequencies in rad/s, magnitude in dB, phase in degrees)
+    """
+    omega, real, imag = _dynamic_stiffness(
+        system.mass, system.stiffness, system.damping, frequencies, freq_unit, dtype
+    )
+    
+    magnitude_db = np.square(real)
+    magnitude_db += np.square(imag)
+    np.log10(magnitude_db, out=magnitude_db)
+    magnitude_db *= -10
+    
+    phase = np.degrees(np.arctan2(-imag, real))
+    
+    return omega, magnitude_db, phase
+
+
 def compute_frf_normalized(
     zeta: float,
-    frequency_ratios: np.ndarray
+    frequency_ratios: np.ndarray,
+    dtype: np.dtype = np.float64
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Compute normalized FRF magnitude and phase.
     
@@ -53,19 +203,14 @@ def compute_frf_normalized(
     Args:
         zeta: Damping ratio
         frequency_ratios: Array of r = ω/ωn values
+        dtype: Floating point type for the computation
     
     Returns:
         Tuple of (magnitude normalized by 1/k, phase in degrees)
     """
-    r = frequency_ratios
-    
-    denominator = (1 - r**2) + 1j * (2 * zeta * r)
-    H_norm = 1.0 / denominator
-    
-    magnitude = np.abs(H_norm)
-    phase = np.angle(H_norm, deg=True)
-    
-    return magnitude, phase
+    # Unit mass and stiffness with c = 2ζ turn D(ω) into (1 - r²) + j2ζr
+    _, real, imag = _dynamic_stiffness(1.0, 1.0, 2 * zeta, frequency_ratios, "rad/s", dtype)
+    return _inverse_polar(real, imag)
 
 
 def magnitude_to_db(magnitude: np.ndarray) -> np.ndarray:
@@ -73,6 +218,7 @@ def magnitude_to_db(magnitude: np.ndarray) -> np.ndarray:
     return 20 * np.log10(magnitude)
 
 
+@lru_cache(maxsize=32)
 def generate_frequency_array(
     f_min: float,
     f_max: float,
@@ -81,6 +227,10 @@ def generate_frequency_array(
 ) -> np.ndarray:
     """Generate an array of frequencies for FRF calculation.
     
+    Logarithmic grids are evaluated as exp(linspace(ln f_min, ln f_max)),
+    which is considerably faster than np.logspace's power(10, ·). Grids are
+    memoized on the arguments and returned read-only; copy before modifying.
+    
     Args:
         f_min: Minimum frequency
         f_max: Maximum frequency
@@ -91,6 +241,14 @@ def generate_frequency_array(
         Array of frequencies
     """
     if log_scale:
-        return np.logspace(np.log10(f_min), np.log10(f_max), n_points)
+        frequencies = np.linspace(np.log(f_min), np.log(f_max), n_points)
+        np.exp(frequencies, out=frequencies)
+        # exp(ln f) can miss by an ulp; keep the endpoints exactly as given
+        if frequencies.size:
+            frequencies[-1] = f_max
+            frequencies[0] = f_min
     else:
-        return np.linspace(f_min, f_max, n_points)
+        frequencies = np.linspace(f_min, f_max, n_points)
+    
+    frequencies.flags.writeable = False
+    return frequencies
@@ -0,0 +1,102 @@
+"""Collections of SDOF systems stored as parallel parameter arrays."""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable
+import numpy as np
+
+from .sdof_system import SDOFSystem
+
+
+@dataclass(frozen=True, eq=False)
+class SDOFSystemArray:
+    """Set of SDOF systems stored as parallel arrays (structure of arrays).
+
+    Parametric studies evaluate many systems over the same frequency grid;
+    keeping the parameters in arrays lets the analysis functions broadcast
+    over all systems at once instead of looping over SDOFSystem objects.
+
+    Attributes:
+        mass: Masses in kg
+        stiffness: Stiffnesses in N/m
+        damping: Damping coefficients in N·s/m
+    """
+    mass: np.ndarray
+    stiffness: np.ndarray
+    damping: np.ndarray
+
+    def __post_init__(self):
+        mass = np.atleast_1d(np.asarray(self.mass, dtype=float))
+        stiffness = np.atleast_1d(np.asarray(self.stiffness, dtype=float))
+        damping = np.atleast_1d(np.asarray(self.damping, dtype=float))
+
+        if not (mass.ndim == 1 and mass.shape == stiffness.shape == damping.shape):
+            raise ValueError(
+                "mass, stiffness and damping must be 1-D arrays of equal length "
+                f"(got shapes {mass.shape}, {stiffness.shape}, {damping.shape})"
+            )
+
+        object.__setattr__(self, "mass", mass)
+        object.__setattr__(self, "stiffness", stiffness)
+        object.__setattr__(self, "damping", damping)
+
+    def __len__(self) -> int:
+        return len(self.mass)
+
+    def __getitem__(self, index: int) -> SDOFSystem:
+        return SDOFSystem(
+            float(self.mass[index]),
+            float(self.stiffness[index]),
+            float(self.damping[index])
+        )
+
+    @cached_property
+    def natural_frequency(self) -> np.ndarray:
+        """Natural frequencies ωn in rad/s."""
+        return np.sqrt(self.stiffness / self.mass)
+
+    @cached_property
+    def natural_frequency_hz(self) -> np.ndarray:
+        """Natural frequencies fn in Hz."""
+        return self.natural_frequency / (2 * np.pi)
+
+    @cached_property
+    def damping_ratio(self) -> np.ndarray:
+        """Damping ratios ζ (dimensionless)."""
+        return self.damping / (2 * np.sqrt(self.stiffness * self.mass))
+
+    @classmethod
+    def from_sequence(cls, systems: Iterable[SDOFSystem]) -> "SDOFSystemArray":
+        """Create an array from individual SDOFSystem instances.
+
+        Args:
+            systems: Iterable of SDOFSystem instances
+        """
+        systems = list(systems)
+        return cls(
+            mass=np.array([s.mass for s in systems], dtype=float),
+            stiffness=np.array([s.stiffness for s in systems], dtype=float),
+            damping=np.array([s.damping for s in systems], dtype=float)
+        )
+
+    @classmethod
+    def from_damping_ratio(
+        cls,
+        mass: np.ndarray,
+        stiffness: np.ndarray,
+        zeta: np.ndarray
+    ) -> "SDOFSystemArray":
+        """Create an array from damping ratios instead of damping coefficients.
+
+        Args:
+            mass: Masses in kg
+            stiffness: Stiffnesses in N/m
+            zeta: Damping ratios (dimensionless)
+        """
+        mass, stiffness, zeta = np.broadcast_arrays(
+            np.asarray(mass, dtype=float),
+            np.asarray(stiffness, dtype=float),
+            np.asarray(zeta, dtype=float)
+        )
+        damping = zeta * 2 * np.sqrt(stiffness * mass)
+        return cls(mass=mass.copy(), stiffness=stiffness.copy(), damping=damping)
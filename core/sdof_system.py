@@ -1,12 +1,16 @@
 """SDOF system dataclass with derived properties."""
 
 from dataclasses import dataclass
+from functools import cached_property
 import numpy as np
 
 
-@dataclass
+@dataclass(frozen=True)
 class SDOFSystem:
     """Single Degree of Freedom vibration system.
+
+    Instances are immutable, so derived properties are computed on first
+    access and cached.
     
     Attributes:
         mass: Mass in kg
@@ -17,22 +21,22 @@ class SDOFSystem:
     stiffness: float
     damping: float
     
-    @property
+    @cached_property
     def natural_frequency(self) -> float:
         """Natural frequency ωn in rad/s."""
         return np.sqrt(self.stiffness / self.mass)
     
-    @property
+    @cached_property
     def natural_frequency_hz(self) -> float:
         """Natural frequency fn in Hz."""
         return self.natural_frequency / (2 * np.pi)
     
-    @property
+    @cached_property
     def damping_ratio(self) -> float:
         """Damping ratio ζ (dimensionless)."""
         return self.damping / (2 * np.sqrt(self.stiffness * self.mass))
     
-    @property
+    @cached_property
     def damped_frequency(self) -> float:
         """Damped natural frequency ωd in rad/s."""
         zeta = self.damping_ratio
@@ -40,27 +44,27 @@ class SDOFSystem:
             return 0.0
         return self.natural_frequency * np.sqrt(1 - zeta**2)
     
-    @property
+    @cached_property
     def damped_frequency_hz(self) -> float:
         """Damped natural frequency fd in Hz."""
         return self.damped_frequency / (2 * np.pi)
     
-    @property
+    @cached_property
     def critical_damping(self) -> float:
         """Critical damping coefficient cc in N·s/m."""
         return 2 * np.sqrt(self.stiffness * self.mass)
 
-    @property
+    @cached_property
     def is_underdamped(self) -> bool:
         """Check if system is underdamped (ζ < 1)."""
         return self.damping_ratio < 1.0
 
-    @property
+    @cached_property
     def is_critically_damped(self) -> bool:
         """Check if system is critically damped (ζ = 1)."""
         return np.isclose(self.damping_ratio, 1.0, rtol=1e-6)
 
-    @property
+    @cached_property
     def is_overdamped(self) -> bool:
         """Check if system is overdamped (ζ > 1)."""
         return self.damping_ratio > 1.0
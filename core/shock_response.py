@@ -1,69 +1,195 @@
 """Shock Response Spectrum (SRS) calculations for SDOF systems."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
 import numpy as np
 from numpy.typing import NDArray
 from scipy import signal
 
+from .frequency_response import FrequencyGrid
+
+# Numerator shape (1 + z⁻¹)² shared by every bilinear-transformed oscillator
+_NEWMARK_NUMERATOR = np.array([1.0, 2.0, 1.0])
+_NEWMARK_NUMERATOR.flags.writeable = False
 
-def generate_shock_pulse(
-    pulse_type: str,
-    duration: float,
-    amplitude: float,
-    dt: float
-) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
-    """Generate a shock pulse.
+
+@lru_cache(maxsize=64)
+def _pulse_shape(pulse_type: str, duration: float, dt: float) -> NDArray[np.floating]:
+    """Unit-amplitude samples of a shock pulse.
+
+    The shape does not depend on the amplitude, so it is memoized separately
+    and shared by every amplitude of a sweep. The returned array is
+    read-only.
 
     Args:
-        pulse_type: Type of pulse ("half_sine", "triangular", "rectangular", "versed_sine", "trapezoidal")
+        pulse_type: Type of pulse (see generate_shock_pulse)
         duration: Pulse duration in seconds
-        amplitude: Peak amplitude (typically in g's or m/s²)
         dt: Time step in seconds
 
     Returns:
-        Tuple of (time array, acceleration array)
+        Pulse samples with unit peak, int(duration / dt) long
     """
-    # Extend time beyond pulse for residual response
-    total_time = duration * 10
-    t = np.arange(0, total_time, dt)
-    accel = np.zeros_like(t)
-
     pulse_samples = int(duration / dt)
-    t_pulse = t[:pulse_samples]
+    t_pulse = np.arange(pulse_samples) * dt
+    shape = np.empty(pulse_samples)
 
     if pulse_type == "half_sine":
-        accel[:pulse_samples] = amplitude * np.sin(np.pi * t_pulse / duration)
+        np.sin(np.pi * t_pulse / duration, out=shape)
 
     elif pulse_type == "triangular":
         mid = pulse_samples // 2
-        accel[:mid] = amplitude * 2 * t_pulse[:mid] / duration
-        accel[mid:pulse_samples] = amplitude * (2 - 2 * t_pulse[mid:pulse_samples] / duration)
+        shape[:mid] = 2 * t_pulse[:mid] / duration
+        shape[mid:] = 2 - 2 * t_pulse[mid:] / duration
 
     elif pulse_type == "rectangular":
-        accel[:pulse_samples] = amplitude
+        shape[:] = 1.0
 
     elif pulse_type == "versed_sine":
         # Versed sine (haversine): (1 - cos(2πt/T)) / 2
-        accel[:pulse_samples] = amplitude * (1 - np.cos(2 * np.pi * t_pulse / duration)) / 2
+        shape[:] = (1 - np.cos(2 * np.pi * t_pulse / duration)) / 2
 
     elif pulse_type == "trapezoidal":
         rise_samples = pulse_samples // 4
         hold_samples = pulse_samples // 2
         fall_start = rise_samples + hold_samples
 
-        accel[:rise_samples] = amplitude * t_pulse[:rise_samples] / (rise_samples * dt)
-        accel[rise_samples:fall_start] = amplitude
-        accel[fall_start:pulse_samples] = amplitude * (1 - (t_pulse[fall_start:pulse_samples] - fall_start * dt) / (rise_samples * dt))
+        shape[:rise_samples] = t_pulse[:rise_samples] / (rise_samples * dt)
+        shape[rise_samples:fall_start] = 1.0
+        shape[fall_start:] = 1 - (t_pulse[fall_start:] - fall_start * dt) / (rise_samples * dt)
 
     elif pulse_type == "initial_peak_sawtooth":
-        accel[:pulse_samples] = amplitude * (1 - t_pulse / duration)
+        shape[:] = 1 - t_pulse / duration
 
     elif pulse_type == "terminal_peak_sawtooth":
-        accel[:pulse_samples] = amplitude * t_pulse / duration
+        shape[:] = t_pulse / duration
+
+    else:
+        shape[:] = 0.0
+
+    shape.flags.writeable = False
+    return shape
+
+
+@lru_cache(maxsize=32)
+def generate_shock_pulse(
+    pulse_type: str,
+    duration: float,
+    amplitude: float,
+    dt: float,
+    post_pulse_factor: float = 9
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """Generate a shock pulse.
+
+    Results are memoized on the arguments so parametric SRS studies over the
+    same pulse do not rebuild it. The returned arrays are shared between
+    calls and therefore read-only; copy them before modifying.
+
+    Args:
+        pulse_type: Type of pulse ("half_sine", "triangular", "rectangular", "versed_sine", "trapezoidal")
+        duration: Pulse duration in seconds
+        amplitude: Peak amplitude (typically in g's or m/s²)
+        dt: Time step in seconds
+        post_pulse_factor: Length of the quiet tail after the pulse, in
+            pulse durations (window for the residual response)
+
+    Returns:
+        Tuple of (time array, acceleration array)
+    """
+    # Extend time beyond pulse for residual response
+    total_time = duration * (1 + post_pulse_factor)
+    t = np.arange(0, total_time, dt)
+
+    shape = _pulse_shape(pulse_type, duration, dt)
+    pulse_samples = len(shape)
+
+    accel = np.empty_like(t)
+    np.multiply(shape, amplitude, out=accel[:pulse_samples])
+    accel[pulse_samples:] = 0.0
+
+    t.flags.writeable = False
+    accel.flags.writeable = False
 
     return t, accel
 
 
+def _newmark_filter(
+    omega_n: float | NDArray[np.floating],
+    damping_ratio: float,
+    dt: float
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """Discrete transfer function of average acceleration Newmark integration.
+
+    The scheme (γ = 1/2, β = 1/4) is identical to the trapezoidal rule, i.e.
+    the bilinear transform of X/P = 1/(s² + 2ζωn·s + ωn²). The coefficients
+    are evaluated in closed form so a whole bank of oscillators is designed
+    in one vectorized pass.
+
+    Args:
+        omega_n: Natural frequency in rad/s (scalar or array)
+        damping_ratio: Damping ratio (zeta)
+        dt: Time step
+
+    Returns:
+        Tuple of (numerator b, denominator a), coefficients on the last axis
+    """
+    omega_n = np.asarray(omega_n, dtype=float)
+    K = 2 / dt
+    K2 = K * K
+    wn2 = omega_n * omega_n
+    damping_term = 2 * damping_ratio * omega_n * K
+
+    b0 = 1 / (K2 + damping_term + wn2)
+    b = b0[..., None] * _NEWMARK_NUMERATOR
+    a = np.stack(
+        [np.ones_like(b0), 2 * (wn2 - K2) * b0, (K2 - damping_term + wn2) * b0],
+        axis=-1,
+    )
+    return b, a
+
+
+def _newmark_initial_state(
+    b: NDArray[np.floating],
+    load: NDArray[np.floating]
+) -> NDArray[np.floating]:
+    """Filter state for starting the Newmark filter from rest.
+
+    Starting at rest (x = v = 0) with a[0] = load[0] corresponds to a filter
+    history of alternating input ±load[0], which the (1 + z⁻¹)² numerator
+    cancels exactly. The resulting initial state is b0·(-load[0], -load[0]).
+
+    Args:
+        b: Filter numerator from _newmark_filter (one row per oscillator)
+        load: Effective load (negated base acceleration)
+
+    Returns:
+        Initial filter state, two values on the last axis
+    """
+    return np.repeat(-load[0] * b[..., :1], 2, axis=-1)
+
+
+def _newmark_response(
+    b: NDArray[np.floating],
+    a: NDArray[np.floating],
+    zi: NDArray[np.floating],
+    load: NDArray[np.floating]
+) -> NDArray[np.floating]:
+    """Run the Newmark filter over an effective load history.
+
+    Args:
+        b: Filter numerator from _newmark_filter
+        a: Filter denominator from _newmark_filter
+        zi: Initial state from _newmark_initial_state
+        load: Effective load (negated base acceleration)
+
+    Returns:
+        Relative displacement response array
+    """
+    x, _ = signal.lfilter(b, a, load, zi=zi)
+    return x
+
+
 def compute_sdof_response(
     natural_freq: float,
     damping_ratio: float,
@@ -72,7 +198,9 @@ def compute_sdof_response(
 ) -> NDArray[np.floating]:
     """Compute SDOF system response to base acceleration.
 
-    Uses the Newmark-beta method for numerical integration.
+    Uses the Newmark-beta method (average acceleration) for numerical
+    integration, evaluated as a second-order IIR filter with
+    scipy.signal.lfilter instead of a Python-level time-stepping loop.
 
     Args:
         natural_freq: Natural frequency in Hz
@@ -83,50 +211,62 @@ def compute_sdof_response(
     Returns:
         Relative displacement response array
     """
-    omega_n = 2 * np.pi * natural_freq
-    omega_d = omega_n * np.sqrt(1 - damping_ratio**2) if damping_ratio < 1 else 0
-
-    n = len(base_accel)
-    x = np.zeros(n)  # Relative displacement
-    v = np.zeros(n)  # Relative velocity
-    a = np.zeros(n)  # Relative acceleration
-
-    # Initial acceleration
-    a[0] = -base_accel[0]
-
-    # Newmark-beta parameters (average acceleration method)
-    gamma = 0.5
-    beta = 0.25
-
-    # Effective stiffness
-    k_eff = omega_n**2 + gamma / (beta * dt) * 2 * damping_ratio * omega_n + 1 / (beta * dt**2)
-
-    for i in range(n - 1):
-        # Effective load
-        p_eff = (-base_accel[i + 1] +
-                 (1 / (beta * dt**2)) * x[i] +
-                 (1 / (beta * dt)) * v[i] +
-                 (1 / (2 * beta) - 1) * a[i] +
-                 2 * damping_ratio * omega_n * (
-                     (gamma / (beta * dt)) * x[i] +
-                     (gamma / beta - 1) * v[i] +
-                     dt * (gamma / (2 * beta) - 1) * a[i]
-                 ))
-
-        # Solve for displacement
-        x[i + 1] = p_eff / k_eff
-
-        # Update velocity and acceleration
-        v[i + 1] = (gamma / (beta * dt)) * (x[i + 1] - x[i]) + (1 - gamma / beta) * v[i] + dt * (1 - gamma / (2 * beta)) * a[i]
-        a[i + 1] = (1 / (beta * dt**2)) * (x[i + 1] - x[i]) - (1 / (beta * dt)) * v[i] - (1 / (2 * beta) - 1) * a[i]
+    b, a = _newmark_filter(2 * np.pi * natural_freq, damping_ratio, dt)
+    load = -np.asarray(base_accel, dtype=float)
+    return _newmark_response(b, a, _newmark_initial_state(b, load), load)
 
-    return x
+
+def _oscillator_peaks(
+    b: NDArray[np.floating],
+    a: NDArray[np.floating],
+    zi: NDArray[np.floating],
+    scale: float,
+    load: NDArray[np.floating],
+    shock_end_idx: int
+) -> tuple[float, float, float, float, float]:
+    """Compute the SRS peaks of a single oscillator.
+
+    Args:
+        b: Filter numerator from _newmark_filter
+        a: Filter denominator from _newmark_filter
+        zi: Initial state from _newmark_initial_state
+        scale: Pseudo-acceleration factor omega_n^2
+        load: Effective load (negated base acceleration)
+        shock_end_idx: Index of the last sample of the shock
+
+    Returns:
+        Tuple of (maxi_max, primary_pos, primary_neg, residual_pos, residual_neg)
+    """
+    # Compute response
+    x = _newmark_response(b, a, zi, load)
+
+    # Pseudo-acceleration is omega_n^2 * x; the scale factor is positive, so
+    # the extremes are taken on x directly and scaled afterwards instead of
+    # materialising the scaled response array.
+
+    # Primary (during shock)
+    primary_response = x[:shock_end_idx + 1]
+    primary_pos = scale * primary_response.max()
+    primary_neg = scale * primary_response.min()
+
+    # Residual (after shock)
+    residual_response = x[shock_end_idx + 1:]
+    residual_pos = 0.0
+    residual_neg = 0.0
+    if len(residual_response) > 0:
+        residual_pos = scale * residual_response.max()
+        residual_neg = scale * residual_response.min()
+
+    # Maxi-max (maximum absolute value overall) follows from the signed peaks
+    maxi_max = max(primary_pos, -primary_neg, residual_pos, -residual_neg)
+
+    return maxi_max, primary_pos, primary_neg, residual_pos, residual_neg
 
 
 def compute_srs(
     base_accel: NDArray[np.floating],
     dt: float,
-    frequencies: NDArray[np.floating],
+    frequencies: NDArray[np.floating] | FrequencyGrid,
     damping_ratio: float = 0.05,
     srs_type: str = "maxi-max"
 ) -> dict[str, NDArray[np.floating]]:
@@ -135,7 +275,8 @@ def compute_srs(
     Args:
         base_accel: Base acceleration time history
         dt: Time step in seconds
-        frequencies: Array of natural frequencies to evaluate (Hz)
+        frequencies: Array of natural frequencies to evaluate (Hz), or a
+            FrequencyGrid
         damping_ratio: Damping ratio for all oscillators (default 5%)
         srs_type: Type of SRS ("maxi-max", "primary", "residual", "all")
 
@@ -148,44 +289,33 @@ def compute_srs(
         - "residual_pos": Maximum positive after shock
         - "residual_neg": Maximum negative after shock
     """
-    n_freq = len(frequencies)
-
     # Find approximate end of shock (where input drops below 1% of peak)
-    peak_accel = np.max(np.abs(base_accel))
-    shock_end_idx = len(base_accel) - 1
-    for i in range(len(base_accel) - 1, -1, -1):
-        if np.abs(base_accel[i]) > 0.01 * peak_accel:
-            shock_end_idx = i
-            break
-
-    # Initialize result arrays
-    maxi_max = np.zeros(n_freq)
-    primary_pos = np.zeros(n_freq)
-    primary_neg = np.zeros(n_freq)
-    residual_pos = np.zeros(n_freq)
-    residual_neg = np.zeros(n_freq)
-
-    for i, fn in enumerate(frequencies):
-        # Compute response
-        x = compute_sdof_response(fn, damping_ratio, base_accel, dt)
-
-        # Convert to pseudo-acceleration (omega_n^2 * x)
-        omega_n = 2 * np.pi * fn
-        response = omega_n**2 * x
-
-        # Primary (during shock)
-        primary_response = response[:shock_end_idx + 1]
-        primary_pos[i] = np.max(primary_response)
-        primary_neg[i] = np.min(primary_response)
-
-        # Residual (after shock)
-        residual_response = response[shock_end_idx + 1:]
-        if len(residual_response) > 0:
-            residual_pos[i] = np.max(residual_response)
-            residual_neg[i] = np.min(residual_response)
-
-        # Maxi-max (maximum absolute value overall)
-        maxi_max[i] = np.max(np.abs(response))
+    abs_accel = np.abs(base_accel)
+    above_threshold = np.flatnonzero(abs_accel > 0.01 * abs_accel.max())
+    shock_end_idx = above_threshold[-1] if above_threshold.size else len(base_accel) - 1
+
+    if isinstance(frequencies, FrequencyGrid):
+        omega_n = frequencies.omega
+        omega_n2 = frequencies.omega2
+        frequencies = frequencies.hz
+    else:
+        omega_n = 2 * np.pi * np.asarray(frequencies, dtype=float)
+        omega_n2 = omega_n * omega_n
+
+    # Design every oscillator's filter and starting state at once
+    b, a = _newmark_filter(omega_n, damping_ratio, dt)
+    load = -np.asarray(base_accel, dtype=float)
+    zi = _newmark_initial_state(b, load)
+
+    # Oscillators are independent; lfilter and the NumPy reductions release
+    # the GIL, so each worker thread integrates a different frequency.
+    oscillator_peaks = partial(_oscillator_peaks, load=load, shock_end_idx=shock_end_idx)
+    with ThreadPoolExecutor() as executor:
+        peaks = np.array(
+            list(executor.map(oscillator_peaks, b, a, zi, omega_n2)), dtype=float
+        ).reshape(-1, 5)
+
+    maxi_max, primary_pos, primary_neg, residual_pos, residual_neg = peaks.T
 
     return {
         "frequencies": frequencies,
@@ -201,7 +331,7 @@ def compute_srs_from_pulse(
     pulse_type: str,
     pulse_duration: float,
     pulse_amplitude: float,
-    frequencies: NDArray[np.floating],
+    frequencies: NDArray[np.floating] | FrequencyGrid,
     damping_ratio: float = 0.05,
     srs_type: str = "maxi-max"
 ) -> dict[str, NDArray[np.floating]]:
@@ -211,19 +341,27 @@ def compute_srs_from_pulse(
         pulse_type: Type of pulse
         pulse_duration: Pulse duration in seconds
         pulse_amplitude: Peak amplitude
-        frequencies: Array of natural frequencies (Hz)
+        frequencies: Array of natural frequencies (Hz), or a FrequencyGrid
         damping_ratio: Damping ratio
         srs_type: Type of SRS
 
     Returns:
         SRS results dictionary
     """
+    frequencies_hz = frequencies.hz if isinstance(frequencies, FrequencyGrid) else frequencies
+
     # Determine appropriate time step (at least 10 points per highest frequency cycle)
-    max_freq = np.max(frequencies)
+    max_freq = np.max(frequencies_hz)
     dt = 1 / (max_freq * 20)
 
+    # Residual window: two periods of the lowest-frequency oscillator
+    min_freq = np.min(frequencies_hz)
+    post_pulse_factor = max(1, int(np.ceil(2 / (min_freq * pulse_duration))))
+
     # Generate pulse
-    t, accel = generate_shock_pulse(pulse_type, pulse_duration, pulse_amplitude, dt)
+    t, accel = generate_shock_pulse(
+        pulse_type, pulse_duration, pulse_amplitude, dt, post_pulse_factor
+    )
 
     # Compute SRS
     return compute_srs(accel, dt, frequencies, damping_ratio, srs_type)
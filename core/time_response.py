@@ -1,10 +1,83 @@
 """Time-domain response calculations for SDOF systems."""
 
+import math
+
 import numpy as np
-from typing import Tuple
-from scipy import signal
+from typing import Optional, Tuple
 from .sdof_system import SDOFSystem
 
+# Output matrices of the state-space form; identical for every system
+_STATE_SPACE_C = np.array([[1.0, 0.0]])
+_STATE_SPACE_C.flags.writeable = False
+_STATE_SPACE_D = np.array([[0.0]])
+_STATE_SPACE_D.flags.writeable = False
+
+
+def _damped_oscillation(
+    t: np.ndarray,
+    sigma: float,
+    omega_d: float,
+    A: float,
+    B: float,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Evaluate exp(-σ·t)·(A·cos(ωd·t) + B·sin(ωd·t)).
+
+    The cosine/sine pair is folded into a single phase-shifted sine,
+    A·cos(θ) + B·sin(θ) = R·sin(θ + ψ) with R = √(A² + B²), ψ = atan2(A, B),
+    so only one trigonometric pass is made over the time array. The
+    expression is built in place in two buffers rather than through a
+    chain of full-length temporaries.
+
+    Args:
+        t: Time array
+        sigma: Decay rate σ = ζωn in 1/s
+        omega_d: Damped natural frequency in rad/s
+        A: Cosine coefficient
+        B: Sine coefficient
+        out: Optional array to write the result into
+
+    Returns:
+        Oscillation values
+    """
+    amplitude = math.hypot(A, B)
+    phase_shift = math.atan2(A, B)
+
+    x = np.multiply(omega_d, t, out=out)
+    x += phase_shift
+    np.sin(x, out=x)
+    x *= amplitude
+
+    work = np.multiply(t, -sigma)
+    np.exp(work, out=work)
+    x *= work
+    return x
+
+
+def _exponential_decay(
+    t: np.ndarray,
+    sigma: float,
+    amplitude: float,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Evaluate amplitude·exp(-σ·t) in a single output buffer.
+
+    Args:
+        t: Time array
+        sigma: Decay rate σ = ζωn in 1/s
+        amplitude: Value at t = 0
+        out: Optional array to write the result into
+
+    Returns:
+        Envelope values
+    """
+    if out is None:
+        out = np.empty(np.shape(t))
+    envelope = np.multiply(t, -sigma, out=out)
+    np.exp(envelope, out=envelope)
+    envelope *= amplitude
+    return envelope
+
 
 def compute_impulse_response(
     system: SDOFSystem,
@@ -41,7 +114,7 @@ def compute_impulse_response(
     
     if zeta < 1:  # Underdamped
         omega_d = system.damped_frequency
-        x = (1 / (m * omega_d)) * np.exp(-zeta * omega_n * t) * np.sin(omega_d * t)
+        x = _damped_oscillation(t, zeta * omega_n, omega_d, 0.0, 1 / (m * omega_d))
     elif zeta == 1:  # Critically damped
         x = (1 / m) * t * np.exp(-omega_n * t)
     else:  # Overdamped
@@ -53,6 +126,38 @@ def compute_impulse_response(
     return t, x
 
 
+def compute_impulse_peak(system: SDOFSystem) -> float:
+    """Compute the peak magnitude of the unit impulse response analytically.
+    
+    For underdamped systems h(t) peaks where tan(ωd·t) = ωd/(ζωn), giving
+    h_max = (1/m·ωn) · exp(-ζωn·t_peak). Critically damped and overdamped
+    responses rise from zero to a single maximum at the root of h'(t) = 0.
+    
+    Args:
+        system: SDOFSystem instance
+    
+    Returns:
+        Peak displacement per unit impulse
+    """
+    omega_n = system.natural_frequency
+    zeta = system.damping_ratio
+    m = system.mass
+    
+    if zeta < 1:  # Underdamped
+        omega_d = system.damped_frequency
+        sigma = zeta * omega_n
+        t_peak = math.atan2(omega_d, sigma) / omega_d
+        return math.exp(-sigma * t_peak) / (m * omega_n)
+    elif zeta == 1:  # Critically damped: t_peak = 1/ωn
+        return 1 / (m * omega_n * math.e)
+    else:  # Overdamped: s1·exp(s1·t) = s2·exp(s2·t)
+        sqrt_term = math.sqrt(zeta**2 - 1)
+        s1 = -omega_n * (zeta + sqrt_term)
+        s2 = -omega_n * (zeta - sqrt_term)
+        t_peak = math.log(s1 / s2) / (s2 - s1)
+        return (math.exp(s2 * t_peak) - math.exp(s1 * t_peak)) / (m * (s2 - s1))
+
+
 def compute_step_response(
     system: SDOFSystem,
     step_magnitude: float = 1.0,
@@ -92,9 +197,10 @@ def compute_step_response(
     
     if zeta < 1:  # Underdamped
         omega_d = system.damped_frequency
-        envelope_decay = np.exp(-zeta * omega_n * t)
-        oscillation = np.cos(omega_d * t) + (zeta * omega_n / omega_d) * np.sin(omega_d * t)
-        x = x_static * (1 - envelope_decay * oscillation)
+        x = _damped_oscillation(
+            t, zeta * omega_n, omega_d, x_static, x_static * zeta * omega_n / omega_d
+        )
+        np.subtract(x_static, x, out=x)
     elif zeta == 1:  # Critically damped
         x = x_static * (1 - (1 + omega_n * t) * np.exp(-omega_n * t))
     else:  # Overdamped
@@ -153,32 +259,36 @@ def compute_harmonic_response(
     r = omega / omega_n
     X0 = force_amplitude / k  # Static deflection
     
-    denominator = np.sqrt((1 - r**2)**2 + (2 * zeta * r)**2)
+    stiffness_term = 1 - r * r
+    damping_term = 2 * zeta * r
+    
+    denominator = math.hypot(stiffness_term, damping_term)
     X = X0 / denominator  # Steady-state amplitude
     
-    phi = np.arctan2(2 * zeta * r, 1 - r**2)  # Phase lag
+    phi = math.atan2(damping_term, stiffness_term)  # Phase lag
     
     # Steady-state response
-    x_steady = X * np.sin(omega * t - phi)
+    x_steady = omega * t
+    x_steady -= phi
+    np.sin(x_steady, out=x_steady)
+    x_steady *= X
     
     if include_transient and zeta < 1:
         # Transient response (to satisfy zero initial conditions)
         omega_d = system.damped_frequency
         
-        # Initial conditions for total response = 0
-        x0 = 0  # Initial displacement
-        v0 = 0  # Initial velocity
-        
         # At t=0: x_steady(0) = -X·sin(phi)
         # At t=0: v_steady(0) = X·ω·cos(phi)
+        sin_phi = math.sin(phi)
+        cos_phi = math.cos(phi)
         
         # Transient must cancel steady-state at t=0
-        A = -(-X * np.sin(-phi))  # = X·sin(phi)
+        A = X * sin_phi
         # v_transient(0) = -zeta·omega_n·A + omega_d·B = -X·omega·cos(phi)
-        B = (-X * omega * np.cos(-phi) + zeta * omega_n * A) / omega_d
+        B = (zeta * omega_n * A - X * omega * cos_phi) / omega_d
         
-        x_transient = np.exp(-zeta * omega_n * t) * (A * np.cos(omega_d * t) + B * np.sin(omega_d * t))
-        x_total = x_steady + x_transient
+        x_total = _damped_oscillation(t, zeta * omega_n, omega_d, A, B)
+        x_total += x_steady
     else:
         x_total = x_steady
     
@@ -188,7 +298,8 @@ def compute_harmonic_response(
 def compute_envelope(
     system: SDOFSystem,
     t: np.ndarray,
-    x0: float = 1.0
+    x0: float = 1.0,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """Compute the exponential decay envelope for free vibration.
     
@@ -198,18 +309,20 @@ def compute_envelope(
         system: SDOFSystem instance
         t: Time array
         x0: Initial amplitude
+        out: Optional array to write the result into
     
     Returns:
         Envelope values (positive)
     """
-    return x0 * np.exp(-system.damping_ratio * system.natural_frequency * t)
+    return _exponential_decay(t, system.damping_ratio * system.natural_frequency, x0, out)
 
 
 def compute_free_vibration(
     system: SDOFSystem,
     time: np.ndarray,
     initial_displacement: float = 1.0,
-    initial_velocity: float = 0.0
+    initial_velocity: float = 0.0,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """Compute free vibration response with given initial conditions.
 
@@ -218,6 +331,8 @@ def compute_free_vibration(
         time: Time array
         initial_displacement: Initial displacement x(0)
         initial_velocity: Initial velocity x'(0)
+        out: Optional array to write the result into, e.g. a buffer reused
+            across recalculations
 
     Returns:
         Displacement array
@@ -231,18 +346,24 @@ def compute_free_vibration(
         omega_d = system.damped_frequency
         A = x0
         B = (v0 + zeta * omega_n * x0) / omega_d
-        x = np.exp(-zeta * omega_n * time) * (A * np.cos(omega_d * time) + B * np.sin(omega_d * time))
+        x = _damped_oscillation(time, zeta * omega_n, omega_d, A, B, out)
     elif np.isclose(zeta, 1.0):  # Critically damped
         A = x0
         B = v0 + omega_n * x0
-        x = (A + B * time) * np.exp(-omega_n * time)
+        # x = (A + B·t)·exp(-ωn·t), built in two buffers
+        x = np.multiply(time, B, out=out)
+        x += A
+        x *= _exponential_decay(time, omega_n, 1.0)
     else:  # Overdamped
         sqrt_term = np.sqrt(zeta**2 - 1)
         s1 = -omega_n * (zeta + sqrt_term)
         s2 = -omega_n * (zeta - sqrt_term)
-        A = (x0 * s2 - v0) / (s2 - s1)
-        B = (v0 - x0 * s1) / (s2 - s1)
-        x = A * np.exp(s1 * time) + B * np.exp(s2 * time)
+        root_spread = s2 - s1
+        A = (x0 * s2 - v0) / root_spread
+        B = (v0 - x0 * s1) / root_spread
+        # Both modes decay (s1, s2 < 0): x = A·exp(s1·t) + B·exp(s2·t)
+        x = _exponential_decay(time, -s1, A, out)
+        x += _exponential_decay(time, -s2, B)
 
     return x
 
@@ -250,7 +371,8 @@ def compute_free_vibration(
 def decay_envelope(
     system: SDOFSystem,
     time: np.ndarray,
-    initial_amplitude: float = 1.0
+    initial_amplitude: float = 1.0,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """Compute the exponential decay envelope for free vibration.
 
@@ -260,11 +382,14 @@ def decay_envelope(
         system: SDOFSystem instance
         time: Time array
         initial_amplitude: Initial amplitude
+        out: Optional array to write the result into
 
     Returns:
         Envelope values (positive)
     """
-    return initial_amplitude * np.exp(-system.damping_ratio * system.natural_frequency * time)
+    return _exponential_decay(
+        time, system.damping_ratio * system.natural_frequency, initial_amplitude, out
+    )
 
 
 def get_state_space(system: SDOFSystem) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
@@ -275,7 +400,8 @@ def get_state_space(system: SDOFSystem) -> Tuple[np.ndarray, np.ndarray, np.ndar
     Output: Displacement x
     
     Returns:
-        Tuple of (A, B, C, D) matrices
+        Tuple of (A, B, C, D) matrices. C and D do not depend on the
+        system and are shared read-only arrays.
     """
     m = system.mass
     k = system.stiffness
@@ -285,7 +411,5 @@ def get_state_space(system: SDOFSystem) -> Tuple[np.ndarray, np.ndarray, np.ndar
                   [-k/m, -c/m]])
     B = np.array([[0],
                   [1/m]])
-    C = np.array([[1, 0]])
-    D = np.array([[0]])
     
-    return A, B, C, D
+    return A, B, _STATE_SPACE_C, _STATE_SPACE_D
@@ -1,14 +1,17 @@
 """Transmissibility calculations for SDOF systems."""
 
+from __future__ import annotations
+
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 from .sdof_system import SDOFSystem
 
 
 def compute_transmissibility(
     system: SDOFSystem,
     frequencies: np.ndarray,
-    freq_unit: str = "rad/s"
+    freq_unit: str = "rad/s",
+    out: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Compute force/displacement transmissibility for an SDOF system.
     
@@ -19,6 +22,7 @@ def compute_transmissibility(
         system: SDOFSystem instance
         frequencies: Array of frequencies
         freq_unit: "rad/s" or "hz"
+        out: Optional array to write TR into
     
     Returns:
         Tuple of (frequency ratios r, transmissibility TR)
@@ -33,51 +37,147 @@ def compute_transmissibility(
     
     r = omega / omega_n
     
-    TR = compute_transmissibility_normalized(zeta, r)
+    TR = _transmissibility_scalar_zeta(zeta, r, out)
     
     return r, TR
 
 
-def compute_transmissibility_normalized(
+def compute_transmissibility_db(
+    system: SDOFSystem,
+    frequencies: np.ndarray,
+    freq_unit: str = "rad/s"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute transmissibility in decibels for an SDOF system.
+    
+    20·log10(TR) is evaluated as 10·log10(num/den) on the squared ratio,
+    so the square root pass of compute_transmissibility is skipped.
+    
+    Args:
+        system: SDOFSystem instance
+        frequencies: Array of frequencies
+        freq_unit: "rad/s" or "hz"
+    
+    Returns:
+        Tuple of (frequency ratios r, transmissibility in dB)
+    """
+    if freq_unit.lower() == "hz":
+        omega = 2 * np.pi * frequencies
+    else:
+        omega = frequencies
+    
+    r = omega / system.natural_frequency
+    
+    TR_db, denominator = _transmissibility_terms(system.damping_ratio, r)
+    TR_db /= denominator
+    np.log10(TR_db, out=TR_db)
+    TR_db *= 10
+    
+    return r, TR_db
+
+
+def _transmissibility_terms(
     zeta: float,
-    frequency_ratios: np.ndarray
+    r: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (1 + (2ζr)², (1-r²)² + (2ζr)²), the squared TR ratio terms."""
+    # r² is computed once and shared: (2ζr)² = 4ζ²·r². The numerator buffer
+    # is built in place (augmented assignment also keeps scalar r working).
+    r2 = r * r
+    
+    numerator = np.multiply(4 * zeta * zeta, r2, out=out)
+    
+    denominator = 1 - r2
+    denominator *= denominator
+    denominator += numerator
+    
+    numerator += 1
+    
+    return numerator, denominator
+
+
+def _transmissibility_scalar_zeta(
+    zeta: float,
+    r: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Transmissibility for a single damping ratio, without any reshaping."""
+    TR, denominator = _transmissibility_terms(zeta, r, out)
+    TR /= denominator
+    TR **= 0.5  # NumPy evaluates a 0.5 power as an in-place sqrt
+    
+    return TR
+
+
+def _transmissibility_batch(
+    zeta: np.ndarray,
+    r: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Transmissibility over a (ζ × r) grid, one row per damping ratio."""
+    # The r-only terms r² and (1-r²)² are computed once and shared by every
+    # row; (2ζr)² = 4ζ²·r²
+    r2 = r * r
+    one_minus_r2_sq = (1 - r2)**2
+    
+    two_zr_sq = np.multiply((4 * zeta * zeta)[:, None], r2[None, :], out=out)
+    
+    denominator = two_zr_sq + one_minus_r2_sq
+    
+    TR = two_zr_sq
+    TR += 1
+    TR /= denominator
+    np.sqrt(TR, out=TR)
+    
+    return TR
+
+
+def compute_transmissibility_normalized(
+    zeta: float | np.ndarray,
+    frequency_ratios: float | np.ndarray,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """Compute normalized transmissibility.
     
     TR = sqrt[(1 + (2ζr)²) / ((1-r²)² + (2ζr)²)]
     
     Args:
-        zeta: Damping ratio
-        frequency_ratios: Array of r = ω/ωn values
+        zeta: Damping ratio, or a 1-D array of damping ratios
+        frequency_ratios: r = ω/ωn value or array of values
+        out: Optional array to write the result into
     
     Returns:
-        Array of transmissibility values
+        Array of transmissibility values; for an array of damping ratios,
+        one row per zeta value
     """
-    r = frequency_ratios
-    
-    numerator = 1 + (2 * zeta * r)**2
-    denominator = (1 - r**2)**2 + (2 * zeta * r)**2
-    
-    TR = np.sqrt(numerator / denominator)
+    r = np.asarray(frequency_ratios, dtype=float)
     
-    return TR
+    if np.ndim(zeta) == 0:
+        return _transmissibility_scalar_zeta(zeta, r, out)
+    # The batch kernel indexes r as a 1-D axis, so a single ratio becomes one column
+    return _transmissibility_batch(np.asarray(zeta, dtype=float), np.atleast_1d(r), out)
 
 
 def compute_transmissibility_multi_zeta(
     zeta_values: List[float],
     frequency_ratios: np.ndarray
-) -> List[np.ndarray]:
+) -> np.ndarray:
     """Compute transmissibility for multiple damping ratios.
     
+    Evaluated as one (ζ × r) broadcast: the r-only term (1-r²)² is computed
+    once and shared by every damping ratio.
+    
     Args:
         zeta_values: List of damping ratios
         frequency_ratios: Array of r = ω/ωn values
     
     Returns:
-        List of transmissibility arrays, one per zeta value
+        Array of shape (len(zeta_values), len(r)), one TR row per zeta value
     """
-    return [compute_transmissibility_normalized(zeta, frequency_ratios) 
-            for zeta in zeta_values]
+    return _transmissibility_batch(
+        np.asarray(zeta_values, dtype=float),
+        np.asarray(frequency_ratios, dtype=float)
+    )
 
 
 def find_crossover_frequency() -> float:
@@ -135,4 +235,4 @@ def peak_transmissibility(zeta: float) -> float:
     if r_peak == 0:
         return 1.0
     
-    return compute_transmissibility_normalized(zeta, np.array([r_peak]))[0]
+    return float(_transmissibility_scalar_zeta(zeta, r_peak))
@@ -1,16 +1,20 @@
 """Main application window for SDOF Vibration Analysis Tool."""
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Callable
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 import numpy as np
 
 from core.sdof_system import SDOFSystem
-from core.frequency_response import compute_frf, magnitude_to_db
-from core.transmissibility import compute_transmissibility, compute_transmissibility_normalized
+from core.frequency_response import compute_frf_db, generate_frequency_array
+from core.transmissibility import compute_transmissibility, compute_transmissibility_multi_zeta
 from core.time_response import (
     compute_impulse_response,
+    compute_impulse_peak,
     compute_step_response,
     compute_harmonic_response,
     compute_free_vibration,
@@ -23,6 +27,22 @@ from .input_panel import InputPanel
 from .plot_panel import PlotPanel
 from .control_panel import ControlPanel
 
+# Upper bound on time-response samples (1 ms resolution up to 20 s)
+_MAX_TIME_POINTS = 20_000
+
+# How often the Tk loop checks for a finished background calculation
+_POLL_INTERVAL_MS = 15
+
+
+def _plot_precision(*arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Downcast computed arrays to float32 for plotting and export.
+
+    The analysis runs in float64; the results kept by the app only feed
+    matplotlib and the CSV export, for which float32's ~7 significant
+    digits are plenty and half the memory traffic.
+    """
+    return tuple(np.asarray(a).astype(np.float32, copy=False) for a in arrays)
+
 
 class SDOFApp(ctk.CTk):
     """Main application window."""
@@ -41,6 +61,11 @@ class SDOFApp(ctk.CTk):
         # Current system and data
         self._system: SDOFSystem | None = None
         self._current_data: dict | None = None
+        self._time_cache: tuple[float, int, np.ndarray] | None = None
+
+        # Calculations run off the Tk thread; NumPy releases the GIL in its
+        # kernels, so the UI keeps painting while a long response computes.
+        self._executor = ThreadPoolExecutor(max_workers=1)
 
         self._setup_ui()
 
@@ -91,127 +116,185 @@ class SDOFApp(ctk.CTk):
             system = self.input_panel.get_system()
             self._system = system
 
+            # Widgets are read here on the Tk thread; only the computation
+            # itself runs on the worker.
             if analysis_type == "Frequency Response":
-                self._calculate_frequency_response()
+                task = partial(
+                    self._calculate_frequency_response,
+                    system,
+                    self.control_panel.get_frequency_range()
+                )
             elif analysis_type == "Transmissibility":
-                self._calculate_transmissibility()
+                task = partial(
+                    self._calculate_transmissibility,
+                    system,
+                    self.control_panel.get_frequency_range(),
+                    self.control_panel.get_multi_zeta()
+                )
             elif analysis_type == "Time Response":
-                self._calculate_time_response()
+                task = partial(
+                    self._calculate_time_response,
+                    system,
+                    self.control_panel.get_time_parameters()
+                )
+            else:
+                return
 
         except ValidationError as e:
             messagebox.showerror("Validation Error", str(e))
+            return
         except Exception as e:
             messagebox.showerror("Error", f"Calculation failed: {str(e)}")
+            return
 
-    def _calculate_frequency_response(self):
-        """Calculate and plot frequency response."""
-        f_min, f_max, n_points = self.control_panel.get_frequency_range()
-        frequencies_hz = np.logspace(np.log10(f_min), np.log10(f_max), n_points)
+        self._poll_calculation(self._executor.submit(task))
 
-        _, magnitude, phase_deg = compute_frf(self._system, frequencies_hz, freq_unit="hz")
-        magnitude_db = magnitude_to_db(magnitude)
+    def _poll_calculation(self, future: Future):
+        """Apply a background calculation's result once it has finished.
 
-        self._current_data = {
+        Polled with after() so the result is stored and plotted on the Tk
+        thread while the event loop stays responsive.
+        """
+        if not future.done():
+            self.after(_POLL_INTERVAL_MS, self._poll_calculation, future)
+            return
+
+        try:
+            data, draw = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Calculation failed: {str(e)}")
+            return
+
+        self._current_data = data
+        draw()
+
+    def _calculate_frequency_response(
+        self,
+        system: SDOFSystem,
+        frequency_range: tuple[float, float, int]
+    ) -> tuple[dict, Callable[[], None]]:
+        """Calculate frequency response; returns the data and its plot call."""
+        f_min, f_max, n_points = frequency_range
+        frequencies_hz = generate_frequency_array(f_min, f_max, n_points)
+
+        _, magnitude_db, phase_deg = compute_frf_db(system, frequencies_hz, freq_unit="hz")
+        frequencies_hz, magnitude_db, phase_deg = _plot_precision(
+            frequencies_hz, magnitude_db, phase_deg
+        )
+
+        data = {
             "type": "frequency_response",
             "frequencies": frequencies_hz,
             "magnitude_db": magnitude_db,
             "phase_deg": phase_deg
         }
 
-        self.plot_panel.plot_frequency_response(
+        return data, partial(
+            self.plot_panel.plot_frequency_response,
             frequencies_hz,
             magnitude_db,
             phase_deg,
-            natural_freq_hz=self._system.natural_frequency_hz
+            natural_freq_hz=system.natural_frequency_hz
         )
 
-    def _calculate_transmissibility(self):
-        """Calculate and plot transmissibility."""
-        f_min, f_max, _ = self.control_panel.get_frequency_range()
+    def _calculate_transmissibility(
+        self,
+        system: SDOFSystem,
+        frequency_range: tuple[float, float, int],
+        multi_zeta: bool
+    ) -> tuple[dict, Callable[[], None]]:
+        """Calculate transmissibility; returns the data and its plot call."""
+        f_min, f_max, _ = frequency_range
         frequencies_hz = np.linspace(f_min, f_max, 500)
 
-        if self.control_panel.get_multi_zeta():
+        if multi_zeta:
             # Multiple zeta curves
-            zeta_values = [0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 1.0]
-            r = frequencies_hz / self._system.natural_frequency_hz
+            zeta_values = np.array([0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 1.0])
+            r = frequencies_hz / system.natural_frequency_hz
 
-            multi_curves = []
-            for z in zeta_values:
-                tr = compute_transmissibility_normalized(z, r)
-                multi_curves.append((z, tr))
+            # One TR row per zeta value
+            tr_curves = compute_transmissibility_multi_zeta(zeta_values, r)
+            frequencies_hz, tr_curves = _plot_precision(frequencies_hz, tr_curves)
 
-            self._current_data = {
+            data = {
                 "type": "transmissibility_multi",
                 "frequencies": frequencies_hz,
-                "curves": multi_curves
+                "zetas": zeta_values,
+                "curves": tr_curves
             }
 
-            self.plot_panel.plot_transmissibility(
+            return data, partial(
+                self.plot_panel.plot_transmissibility_batch,
                 frequencies_hz,
-                multi_curves[0][1],  # First curve for reference
-                self._system.damping_ratio,
-                natural_freq_hz=self._system.natural_frequency_hz,
-                multi_zeta=multi_curves
+                zeta_values,
+                tr_curves,
+                natural_freq_hz=system.natural_frequency_hz
             )
-        else:
-            _, transmissibility = compute_transmissibility(self._system, frequencies_hz, freq_unit="hz")
 
-            self._current_data = {
-                "type": "transmissibility",
-                "frequencies": frequencies_hz,
-                "transmissibility": transmissibility
-            }
+        _, transmissibility = compute_transmissibility(system, frequencies_hz, freq_unit="hz")
+        frequencies_hz, transmissibility = _plot_precision(frequencies_hz, transmissibility)
 
-            self.plot_panel.plot_transmissibility(
-                frequencies_hz,
-                transmissibility,
-                self._system.damping_ratio,
-                natural_freq_hz=self._system.natural_frequency_hz
-            )
+        data = {
+            "type": "transmissibility",
+            "frequencies": frequencies_hz,
+            "transmissibility": transmissibility
+        }
 
-    def _calculate_time_response(self):
-        """Calculate and plot time response."""
-        params = self.control_panel.get_time_parameters()
+        return data, partial(
+            self.plot_panel.plot_transmissibility,
+            frequencies_hz,
+            transmissibility,
+            system.damping_ratio,
+            natural_freq_hz=system.natural_frequency_hz
+        )
+
+    def _time_grid(self, duration: float, n_points: int) -> np.ndarray:
+        """Return the (read-only) time array, reused while its inputs are unchanged."""
+        if self._time_cache is not None and self._time_cache[:2] == (duration, n_points):
+            return self._time_cache[2]
+
+        time = np.linspace(0, duration, n_points)
+        time.flags.writeable = False
+        self._time_cache = (duration, n_points, time)
+        return time
+
+    def _calculate_time_response(
+        self,
+        system: SDOFSystem,
+        params: dict
+    ) -> tuple[dict, Callable[[], None]]:
+        """Calculate time response; returns the data and its plot call."""
         duration = params["duration"]
-        n_points = int(duration * 1000)  # 1 ms resolution
+        n_points = min(int(duration * 1000), _MAX_TIME_POINTS)  # 1 ms resolution
 
         response_type = params["response_type"]
 
         if response_type == "Impulse":
             time, displacement = compute_impulse_response(
-                self._system, t_end=duration, n_points=n_points
+                system, t_end=duration, n_points=n_points
             )
-            env = decay_envelope(self._system, time, np.max(np.abs(displacement)))
-
-            self._current_data = {
-                "type": "time_response",
-                "response_type": "Impulse Response",
-                "time": time,
-                "displacement": displacement
-            }
+            env = decay_envelope(system, time, compute_impulse_peak(system))
+            time, displacement, env = _plot_precision(time, displacement, env)
 
-            self.plot_panel.plot_time_response(
+            title = "Impulse Response"
+            draw = partial(
+                self.plot_panel.plot_time_response,
                 time, displacement, "Impulse Response", envelope=env
             )
 
         elif response_type == "Step":
             time, displacement = compute_step_response(
-                self._system, t_end=duration, n_points=n_points
+                system, t_end=duration, n_points=n_points
             )
+            time, displacement = _plot_precision(time, displacement)
 
-            self._current_data = {
-                "type": "time_response",
-                "response_type": "Step Response",
-                "time": time,
-                "displacement": displacement
-            }
-
-            self.plot_panel.plot_time_response(time, displacement, "Step Response")
+            title = "Step Response"
+            draw = partial(self.plot_panel.plot_time_response, time, displacement, "Step Response")
 
         elif response_type == "Harmonic":
             excitation_freq = params["excitation_freq"]
             time, displacement, _ = compute_harmonic_response(
-                self._system,
+                system,
                 excitation_freq=excitation_freq,
                 t_end=duration,
                 n_points=n_points,
@@ -220,38 +303,42 @@ class SDOFApp(ctk.CTk):
 
             # Calculate steady-state amplitude
             omega = 2 * np.pi * excitation_freq
-            m, k, c = self._system.mass, self._system.stiffness, self._system.damping
-            steady_amp = 1.0 / np.sqrt((k - m * omega**2)**2 + (c * omega)**2)
-
-            self._current_data = {
-                "type": "time_response",
-                "response_type": f"Harmonic Response (f={excitation_freq} Hz)",
-                "time": time,
-                "displacement": displacement
-            }
+            m, k, c = system.mass, system.stiffness, system.damping
+            steady_amp = 1.0 / np.hypot(k - m * omega * omega, c * omega)
+            time, displacement = _plot_precision(time, displacement)
 
-            self.plot_panel.plot_harmonic_response(
+            title = f"Harmonic Response (f={excitation_freq} Hz)"
+            draw = partial(
+                self.plot_panel.plot_harmonic_response,
                 time, displacement, excitation_freq, steady_amp
             )
 
         elif response_type == "Free Vibration":
-            time = np.linspace(0, duration, n_points)
+            time = self._time_grid(duration, n_points)
             displacement = compute_free_vibration(
-                self._system, time, initial_displacement=1.0, initial_velocity=0.0
+                system, time, initial_displacement=1.0, initial_velocity=0.0
             )
-            env = decay_envelope(self._system, time, 1.0)
-
-            self._current_data = {
-                "type": "time_response",
-                "response_type": "Free Vibration",
-                "time": time,
-                "displacement": displacement
-            }
+            env = decay_envelope(system, time, 1.0)
+            time, displacement, env = _plot_precision(time, displacement, env)
 
-            self.plot_panel.plot_time_response(
+            title = "Free Vibration"
+            draw = partial(
+                self.plot_panel.plot_time_response,
                 time, displacement, "Free Vibration (x₀=1, v₀=0)", envelope=env
             )
 
+        else:
+            raise ValueError(f"Unknown response type: {response_type}")
+
+        data = {
+            "type": "time_response",
+            "response_type": title,
+            "time": time,
+            "displacement": displacement
+        }
+
+        return data, draw
+
     def _on_export_plot(self):
         """Export current plot to image file."""
         if self._current_data is None:
@@ -276,14 +363,19 @@ class SDOFApp(ctk.CTk):
                 messagebox.showerror("Export Error", str(e))
 
     def _on_export_data(self):
-        """Export current data to CSV file."""
+        """Export current data to a CSV, Parquet, Feather or Arrow IPC file."""
         if self._current_data is None:
             messagebox.showwarning("No Data", "Please calculate first before exporting.")
             return
 
         filepath = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV File", "*.csv")],
+            filetypes=[
+                ("CSV File", "*.csv"),
+                ("Parquet File", "*.parquet"),
+                ("Feather File", "*.feather"),
+                ("Arrow IPC File", "*.arrow"),
+            ],
             title="Export Data"
         )
 
@@ -310,10 +402,14 @@ class SDOFApp(ctk.CTk):
                     system_info
                 )
             elif data_type in ("transmissibility", "transmissibility_multi"):
+                if data_type == "transmissibility_multi":
+                    transmissibility = self._current_data["curves"][0]
+                else:
+                    transmissibility = self._current_data["transmissibility"]
                 export_transmissibility(
                     filepath,
                     self._current_data["frequencies"],
-                    self._current_data.get("transmissibility", self._current_data.get("curves", [(0, [])])[0][1]),
+                    transmissibility,
                     system_info
                 )
             elif data_type == "time_response":
@@ -330,6 +426,11 @@ class SDOFApp(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Export Error", str(e))
 
+    def destroy(self):
+        """Stop the calculation worker when the window closes."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
 
 def run():
     """Run the application."""
@@ -3,6 +3,13 @@
 from typing import Callable, Optional
 import customtkinter as ctk
 
+# Internal mode name for each analysis type shown on the selector
+_MODES = {
+    "Frequency Response": "frequency",
+    "Transmissibility": "transmissibility",
+    "Time Response": "time",
+}
+
 
 class ControlPanel(ctk.CTkFrame):
     """Panel for analysis type selection and control options."""
@@ -40,12 +47,24 @@ class ControlPanel(ctk.CTkFrame):
         self.analysis_type.set("Frequency Response")
         self.analysis_type.grid(row=0, column=0, columnspan=4, padx=10, pady=10, sticky="ew")
 
-        # Options frame (changes based on analysis type)
-        self.options_frame = ctk.CTkFrame(self)
-        self.options_frame.grid(row=1, column=0, columnspan=4, padx=10, pady=5, sticky="ew")
-        self.options_frame.grid_columnconfigure((0, 1, 2, 3, 4, 5), weight=1)
+        # Option frames, one per analysis type. All are built once and
+        # swapped with grid()/grid_remove(), which keeps their entries.
+        self._freq_frame = self._create_options_frame()
+        self._trans_frame = self._create_options_frame()
+        self._time_frame = self._create_options_frame()
 
         self._setup_frequency_options()
+        self._setup_transmissibility_options()
+        self._setup_time_options()
+
+        self._option_frames = {
+            "frequency": self._freq_frame,
+            "transmissibility": self._trans_frame,
+            "time": self._time_frame,
+        }
+        self._mode = "frequency"
+        self._active_options = self._freq_frame
+        self._active_options.grid(row=1, column=0, columnspan=4, padx=10, pady=5, sticky="ew")
 
         # Calculate button
         self.calc_button = ctk.CTkButton(
@@ -76,57 +95,58 @@ class ControlPanel(ctk.CTkFrame):
         )
         self.export_data_button.grid(row=2, column=3, padx=10, pady=10, sticky="ew")
 
-    def _clear_options(self):
-        """Clear the options frame."""
-        for widget in self.options_frame.winfo_children():
-            widget.destroy()
+    def _create_options_frame(self) -> ctk.CTkFrame:
+        """Create an (ungridded) frame for one analysis type's options."""
+        frame = ctk.CTkFrame(self)
+        frame.grid_columnconfigure((0, 1, 2, 3, 4, 5), weight=1)
+        return frame
 
     def _setup_frequency_options(self):
         """Set up frequency response options."""
-        self._clear_options()
+        frame = self._freq_frame
 
-        ctk.CTkLabel(self.options_frame, text="Freq min (Hz):").grid(
+        ctk.CTkLabel(frame, text="Freq min (Hz):").grid(
             row=0, column=0, padx=5, pady=5, sticky="e"
         )
-        self.freq_min_entry = ctk.CTkEntry(self.options_frame, width=80)
+        self.freq_min_entry = ctk.CTkEntry(frame, width=80)
         self.freq_min_entry.insert(0, "0.1")
         self.freq_min_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
 
-        ctk.CTkLabel(self.options_frame, text="Freq max (Hz):").grid(
+        ctk.CTkLabel(frame, text="Freq max (Hz):").grid(
             row=0, column=2, padx=5, pady=5, sticky="e"
         )
-        self.freq_max_entry = ctk.CTkEntry(self.options_frame, width=80)
+        self.freq_max_entry = ctk.CTkEntry(frame, width=80)
         self.freq_max_entry.insert(0, "100")
         self.freq_max_entry.grid(row=0, column=3, padx=5, pady=5, sticky="w")
 
-        ctk.CTkLabel(self.options_frame, text="Points:").grid(
+        ctk.CTkLabel(frame, text="Points:").grid(
             row=0, column=4, padx=5, pady=5, sticky="e"
         )
-        self.n_points_entry = ctk.CTkEntry(self.options_frame, width=80)
+        self.n_points_entry = ctk.CTkEntry(frame, width=80)
         self.n_points_entry.insert(0, "1000")
         self.n_points_entry.grid(row=0, column=5, padx=5, pady=5, sticky="w")
 
     def _setup_transmissibility_options(self):
         """Set up transmissibility options."""
-        self._clear_options()
+        frame = self._trans_frame
 
-        ctk.CTkLabel(self.options_frame, text="Freq min (Hz):").grid(
+        ctk.CTkLabel(frame, text="Freq min (Hz):").grid(
             row=0, column=0, padx=5, pady=5, sticky="e"
         )
-        self.freq_min_entry = ctk.CTkEntry(self.options_frame, width=80)
-        self.freq_min_entry.insert(0, "0.1")
-        self.freq_min_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        self.tr_freq_min_entry = ctk.CTkEntry(frame, width=80)
+        self.tr_freq_min_entry.insert(0, "0.1")
+        self.tr_freq_min_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
 
-        ctk.CTkLabel(self.options_frame, text="Freq max (Hz):").grid(
+        ctk.CTkLabel(frame, text="Freq max (Hz):").grid(
             row=0, column=2, padx=5, pady=5, sticky="e"
         )
-        self.freq_max_entry = ctk.CTkEntry(self.options_frame, width=80)
-        self.freq_max_entry.insert(0, "100")
-        self.freq_max_entry.grid(row=0, column=3, padx=5, pady=5, sticky="w")
+        self.tr_freq_max_entry = ctk.CTkEntry(frame, width=80)
+        self.tr_freq_max_entry.insert(0, "100")
+        self.tr_freq_max_entry.grid(row=0, column=3, padx=5, pady=5, sticky="w")
 
         self.multi_zeta_var = ctk.BooleanVar(value=False)
         self.multi_zeta_check = ctk.CTkCheckBox(
-            self.options_frame,
+            frame,
             text="Show multiple ζ curves",
             variable=self.multi_zeta_var
         )
@@ -134,13 +154,13 @@ class ControlPanel(ctk.CTkFrame):
 
     def _setup_time_options(self):
         """Set up time response options."""
-        self._clear_options()
+        frame = self._time_frame
 
-        ctk.CTkLabel(self.options_frame, text="Response:").grid(
+        ctk.CTkLabel(frame, text="Response:").grid(
             row=0, column=0, padx=5, pady=5, sticky="e"
         )
         self.time_response_type = ctk.CTkComboBox(
-            self.options_frame,
+            frame,
             values=["Impulse", "Step", "Harmonic", "Free Vibration"],
             width=120,
             command=self._on_time_response_type_changed
@@ -148,17 +168,17 @@ class ControlPanel(ctk.CTkFrame):
         self.time_response_type.set("Impulse")
         self.time_response_type.grid(row=0, column=1, padx=5, pady=5, sticky="w")
 
-        ctk.CTkLabel(self.options_frame, text="Duration (s):").grid(
+        ctk.CTkLabel(frame, text="Duration (s):").grid(
             row=0, column=2, padx=5, pady=5, sticky="e"
         )
-        self.duration_entry = ctk.CTkEntry(self.options_frame, width=80)
+        self.duration_entry = ctk.CTkEntry(frame, width=80)
         self.duration_entry.insert(0, "5")
         self.duration_entry.grid(row=0, column=3, padx=5, pady=5, sticky="w")
 
         # Excitation frequency (only visible for Harmonic)
-        self._excitation_label = ctk.CTkLabel(self.options_frame, text="Excitation freq (Hz):")
+        self._excitation_label = ctk.CTkLabel(frame, text="Excitation freq (Hz):")
         self._excitation_label.grid(row=0, column=4, padx=5, pady=5, sticky="e")
-        self.excitation_freq_entry = ctk.CTkEntry(self.options_frame, width=80)
+        self.excitation_freq_entry = ctk.CTkEntry(frame, width=80)
         self.excitation_freq_entry.insert(0, "1.5")
         self.excitation_freq_entry.grid(row=0, column=5, padx=5, pady=5, sticky="w")
         self._excitation_entry = self.excitation_freq_entry
@@ -185,12 +205,14 @@ class ControlPanel(ctk.CTkFrame):
 
     def _on_analysis_type_changed(self, value: str):
         """Handle analysis type change."""
-        if value == "Frequency Response":
-            self._setup_frequency_options()
-        elif value == "Transmissibility":
-            self._setup_transmissibility_options()
-        elif value == "Time Response":
-            self._setup_time_options()
+        mode = _MODES.get(value)
+        if mode is None or mode == self._mode:
+            return
+
+        self._mode = mode
+        self._active_options.grid_remove()
+        self._active_options = self._option_frames[mode]
+        self._active_options.grid(row=1, column=0, columnspan=4, padx=10, pady=5, sticky="ew")
 
     def _on_calculate(self):
         """Handle calculate button click."""
@@ -217,9 +239,15 @@ class ControlPanel(ctk.CTkFrame):
         Returns:
             Tuple of (f_min, f_max, n_points)
         """
+        if self._mode == "transmissibility":
+            # Transmissibility uses a fixed grid and has no points entry
+            f_min = float(self.tr_freq_min_entry.get())
+            f_max = float(self.tr_freq_max_entry.get())
+            return f_min, f_max, 1000
+
         f_min = float(self.freq_min_entry.get())
         f_max = float(self.freq_max_entry.get())
-        n_points = int(self.n_points_entry.get()) if hasattr(self, 'n_points_entry') else 1000
+        n_points = int(self.n_points_entry.get())
         return f_min, f_max, n_points
 
     def get_time_parameters(self) -> dict:
@@ -236,6 +264,4 @@ class ControlPanel(ctk.CTkFrame):
 
     def get_multi_zeta(self) -> bool:
         """Get whether to show multiple zeta curves."""
-        if hasattr(self, 'multi_zeta_var'):
-            return self.multi_zeta_var.get()
-        return False
+        return self._mode == "transmissibility" and self.multi_zeta_var.get()
@@ -1,10 +1,83 @@
 """Parameter input panel for SDOF system."""
 
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, Optional
 import customtkinter as ctk
 
 from core.sdof_system import SDOFSystem
-from utils.validators import parse_float, validate_positive, validate_non_negative, ValidationError
+from utils.validators import (
+    _FLOAT_RE,
+    parse_float,
+    validate_positive,
+    validate_non_negative,
+    ValidationError,
+)
+
+# Quiet period after the last keystroke before derived values are updated
+_UPDATE_DELAY_MS = 150
+
+# How often a pending derived-value evaluation is checked for completion
+_POLL_INTERVAL_MS = 15
+
+# Any text that can still be typed into a number parse_float accepts
+# ("", "-", ".", "1e", "2.5E-", ...)
+_PARTIAL_FLOAT_RE = re.compile(r"[+-]?\d*\.?\d*(?:[eE][+-]?\d*)?")
+
+
+def _is_incomplete(text: str) -> bool:
+    """Whether text is a number the user is still in the middle of typing."""
+    text = text.strip()
+    return _FLOAT_RE.fullmatch(text) is None and _PARTIAL_FLOAT_RE.fullmatch(text) is not None
+
+
+def _build_system(mass_text: str, stiffness_text: str, damping_text: str, use_ratio: bool) -> SDOFSystem:
+    """Parse and validate the raw entry texts into an SDOF system.
+
+    Raises:
+        ValidationError: If inputs are invalid
+    """
+    mass = parse_float(mass_text, "Mass")
+    stiffness = parse_float(stiffness_text, "Stiffness")
+    damping_value = parse_float(damping_text, "Damping")
+
+    mass = validate_positive(mass, "Mass")
+    stiffness = validate_positive(stiffness, "Stiffness")
+    damping_value = validate_non_negative(damping_value, "Damping")
+
+    if use_ratio:
+        return SDOFSystem.from_damping_ratio(mass, stiffness, damping_value)
+    else:
+        return SDOFSystem(mass, stiffness, damping_value)
+
+
+def _evaluate_inputs(
+    mass_text: str, stiffness_text: str, damping_text: str, use_ratio: bool
+) -> tuple[SDOFSystem, tuple[str, str, str, str, str]]:
+    """Build the system and format its derived properties for display.
+
+    Runs on the panel's worker thread; touches no widgets.
+    """
+    system = _build_system(mass_text, stiffness_text, damping_text, use_ratio)
+    return system, _describe_system(system)
+
+
+def _describe_system(system: SDOFSystem) -> tuple[str, str, str, str, str]:
+    """Format the derived properties shown in the panel."""
+    if system.is_underdamped:
+        damping_type = "Underdamped"
+    elif system.is_critically_damped:
+        damping_type = "Critically Damped"
+    else:
+        damping_type = "Overdamped"
+
+    return (
+        f"{system.natural_frequency:.4g}",
+        f"{system.natural_frequency_hz:.4g}",
+        f"{system.damping_ratio:.4g}",
+        f"{system.damped_frequency:.4g}",
+        damping_type,
+    )
 
 
 class InputPanel(ctk.CTkFrame):
@@ -20,6 +93,14 @@ class InputPanel(ctk.CTkFrame):
 
         self.on_system_changed = on_system_changed
         self._use_damping_ratio = False
+        self._pending_update: Optional[str] = None
+        self._last_inputs: Optional[tuple[str, str, str, bool]] = None
+        self._last_emitted: Optional[tuple[float, float, float]] = None
+
+        # Derived values are evaluated off the Tk thread; the token identifies
+        # the newest request so that results of superseded ones are dropped
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._update_token = 0
 
         self._setup_ui()
         self._set_default_values()
@@ -86,37 +167,50 @@ class InputPanel(ctk.CTkFrame):
         ctk.CTkLabel(self, text="ωn (rad/s):").grid(
             row=7, column=0, padx=10, pady=3, sticky="w"
         )
-        self.omega_n_label = ctk.CTkLabel(self, text="—")
+        self._omega_n_var = ctk.StringVar(value="—")
+        self.omega_n_label = ctk.CTkLabel(self, textvariable=self._omega_n_var)
         self.omega_n_label.grid(row=7, column=1, padx=10, pady=3, sticky="w")
 
         # Natural frequency Hz
         ctk.CTkLabel(self, text="fn (Hz):").grid(
             row=8, column=0, padx=10, pady=3, sticky="w"
         )
-        self.f_n_label = ctk.CTkLabel(self, text="—")
+        self._f_n_var = ctk.StringVar(value="—")
+        self.f_n_label = ctk.CTkLabel(self, textvariable=self._f_n_var)
         self.f_n_label.grid(row=8, column=1, padx=10, pady=3, sticky="w")
 
         # Damping ratio
         ctk.CTkLabel(self, text="ζ:").grid(
             row=9, column=0, padx=10, pady=3, sticky="w"
         )
-        self.zeta_label = ctk.CTkLabel(self, text="—")
+        self._zeta_var = ctk.StringVar(value="—")
+        self.zeta_label = ctk.CTkLabel(self, textvariable=self._zeta_var)
         self.zeta_label.grid(row=9, column=1, padx=10, pady=3, sticky="w")
 
         # Damped frequency
         ctk.CTkLabel(self, text="ωd (rad/s):").grid(
             row=10, column=0, padx=10, pady=3, sticky="w"
         )
-        self.omega_d_label = ctk.CTkLabel(self, text="—")
+        self._omega_d_var = ctk.StringVar(value="—")
+        self.omega_d_label = ctk.CTkLabel(self, textvariable=self._omega_d_var)
         self.omega_d_label.grid(row=10, column=1, padx=10, pady=3, sticky="w")
 
         # Damping type indicator
         ctk.CTkLabel(self, text="Damping Type:").grid(
             row=11, column=0, padx=10, pady=3, sticky="w"
         )
-        self.damping_type_label = ctk.CTkLabel(self, text="—")
+        self._damping_regime_var = ctk.StringVar(value="—")
+        self.damping_type_label = ctk.CTkLabel(self, textvariable=self._damping_regime_var)
         self.damping_type_label.grid(row=11, column=1, padx=10, pady=3, sticky="w")
 
+        self._derived_vars = (
+            self._omega_n_var,
+            self._f_n_var,
+            self._zeta_var,
+            self._omega_d_var,
+            self._damping_regime_var,
+        )
+
         # Error message
         self.error_label = ctk.CTkLabel(
             self,
@@ -135,70 +229,132 @@ class InputPanel(ctk.CTkFrame):
 
     def _on_damping_type_changed(self, value: str):
         """Handle damping type toggle."""
-        self._use_damping_ratio = (value == "Ratio")
+        # Read the system while the entry is still interpreted in the old mode
+        try:
+            system = self.get_system()
+        except ValidationError:
+            system = None
+
+        self._set_damping_mode(value == "Ratio")
 
         if self._use_damping_ratio:
-            self.damping_label.configure(text="Damping ratio (ζ):")
             # Convert current coefficient to ratio if valid
-            try:
-                system = self.get_system()
-                self.damping_entry.delete(0, "end")
-                self.damping_entry.insert(0, f"{system.damping_ratio:.4g}")
-            except (ValidationError, ValueError):
-                self.damping_entry.delete(0, "end")
-                self.damping_entry.insert(0, "0.1")
+            converted = f"{system.damping_ratio:.4g}" if system else "0.1"
         else:
-            self.damping_label.configure(text="Damping (N·s/m):")
             # Convert current ratio to coefficient if valid
-            try:
-                system = self.get_system()
-                self.damping_entry.delete(0, "end")
-                self.damping_entry.insert(0, f"{system.damping:.4g}")
-            except (ValidationError, ValueError):
-                self.damping_entry.delete(0, "end")
-                self.damping_entry.insert(0, "20")
+            converted = f"{system.damping:.4g}" if system else "20"
 
-        self._update_derived_values()
+        self.damping_entry.delete(0, "end")
+        self.damping_entry.insert(0, converted)
+
+        if system is None:
+            self._update_derived_values()
+        else:
+            self._update_derived_values_with(system)
+
+    def _set_damping_mode(self, use_ratio: bool):
+        """Switch how the damping entry is interpreted, without converting it."""
+        self._use_damping_ratio = use_ratio
+        self.damping_label.configure(
+            text="Damping ratio (ζ):" if use_ratio else "Damping (N·s/m):"
+        )
 
     def _on_parameter_changed(self, event=None):
         """Handle parameter change."""
+        self._schedule_update()
+
+    def _schedule_update(self):
+        """Collapse a burst of edits into a single derived-value update."""
+        if self._pending_update is not None:
+            self.after_cancel(self._pending_update)
+        self._pending_update = self.after(_UPDATE_DELAY_MS, self._do_update)
+
+    def _do_update(self):
+        """Run the scheduled derived-value update."""
+        self._pending_update = None
         self._update_derived_values()
 
     def _update_derived_values(self):
         """Update derived property labels."""
-        self.error_label.configure(text="")
+        # Cursor and modifier keys also fire KeyRelease; skip unchanged input
+        key = (
+            self.mass_entry.get(),
+            self.stiffness_entry.get(),
+            self.damping_entry.get(),
+            self._use_damping_ratio,
+        )
+        if key == self._last_inputs:
+            return
 
-        try:
-            system = self.get_system()
+        self._update_token += 1
+
+        # Half-typed numbers are not errors yet; blank the results quietly
+        # instead of parsing (and failing on) them
+        if any(_is_incomplete(text) for text in key[:3]):
+            self.error_label.configure(text="")
+            self._clear_derived_values()
+            self._last_inputs = None
+            return
+
+        future = self._executor.submit(_evaluate_inputs, *key)
+        self._poll_derived_values(future, self._update_token, key)
 
-            self.omega_n_label.configure(text=f"{system.natural_frequency:.4g}")
-            self.f_n_label.configure(text=f"{system.natural_frequency_hz:.4g}")
-            self.zeta_label.configure(text=f"{system.damping_ratio:.4g}")
-            self.omega_d_label.configure(text=f"{system.damped_frequency:.4g}")
+    def _poll_derived_values(self, future: Future, token: int, key: tuple[str, str, str, bool]):
+        """Apply a finished evaluation on the Tk thread unless it is stale."""
+        if not future.done():
+            self.after(_POLL_INTERVAL_MS, self._poll_derived_values, future, token, key)
+            return
 
-            if system.is_underdamped:
-                self.damping_type_label.configure(text="Underdamped")
-            elif system.is_critically_damped:
-                self.damping_type_label.configure(text="Critically Damped")
-            else:
-                self.damping_type_label.configure(text="Overdamped")
+        if token != self._update_token:
+            return
 
-            if self.on_system_changed:
-                self.on_system_changed(system)
+        self.error_label.configure(text="")
 
+        try:
+            system, texts = future.result()
+            self._apply_derived_values(system, texts, key)
         except ValidationError as e:
             self._clear_derived_values()
             self.error_label.configure(text=str(e))
-        except ValueError:
-            self._clear_derived_values()
+            self._last_inputs = None
+
+    def _update_derived_values_with(self, system: SDOFSystem):
+        """Show the derived values of an already-parsed system.
+
+        Used when the caller has just built ``system`` from the entries, so
+        the inputs are not parsed a second time.
+        """
+        key = (
+            self.mass_entry.get(),
+            self.stiffness_entry.get(),
+            self.damping_entry.get(),
+            self._use_damping_ratio,
+        )
+        # Supersede any evaluation still running on the worker
+        self._update_token += 1
+        self.error_label.configure(text="")
+        self._apply_derived_values(system, _describe_system(system), key)
+
+    def _apply_derived_values(
+        self, system: SDOFSystem, texts: tuple[str, ...], key: tuple[str, str, str, bool]
+    ):
+        """Display formatted derived values and notify listeners of a new system."""
+        for var, text in zip(self._derived_vars, texts):
+            var.set(text)
+
+        # Only notify listeners when the system itself changed, e.g. not
+        # for "10" -> "10.0" or a coefficient/ratio toggle
+        signature = (system.mass, system.stiffness, system.damping)
+        if self.on_system_changed and signature != self._last_emitted:
+            self.on_system_changed(system)
+            self._last_emitted = signature
+
+        self._last_inputs = key
 
     def _clear_derived_values(self):
         """Clear all derived value labels."""
-        self.omega_n_label.configure(text="—")
-        self.f_n_label.configure(text="—")
-        self.zeta_label.configure(text="—")
-        self.omega_d_label.configure(text="—")
-        self.damping_type_label.configure(text="—")
+        for var in self._derived_vars:
+            var.set("—")
 
     def get_system(self) -> SDOFSystem:
         """Get the current SDOF system from inputs.
@@ -209,18 +365,12 @@ class InputPanel(ctk.CTkFrame):
         Raises:
             ValidationError: If inputs are invalid
         """
-        mass = parse_float(self.mass_entry.get(), "Mass")
-        stiffness = parse_float(self.stiffness_entry.get(), "Stiffness")
-        damping_value = parse_float(self.damping_entry.get(), "Damping")
-
-        mass = validate_positive(mass, "Mass")
-        stiffness = validate_positive(stiffness, "Stiffness")
-        damping_value = validate_non_negative(damping_value, "Damping")
-
-        if self._use_damping_ratio:
-            return SDOFSystem.from_damping_ratio(mass, stiffness, damping_value)
-        else:
-            return SDOFSystem(mass, stiffness, damping_value)
+        return _build_system(
+            self.mass_entry.get(),
+            self.stiffness_entry.get(),
+            self.damping_entry.get(),
+            self._use_damping_ratio,
+        )
 
     def set_values(self, mass: float, stiffness: float, damping: float, use_ratio: bool = False):
         """Set parameter values programmatically.
@@ -231,6 +381,8 @@ class InputPanel(ctk.CTkFrame):
             damping: Damping coefficient or ratio
             use_ratio: Whether damping is a ratio
         """
+        # Programmatic edits fire no KeyRelease, so the derived values are
+        # evaluated once, after all entries are filled
         self.mass_entry.delete(0, "end")
         self.mass_entry.insert(0, str(mass))
 
@@ -238,10 +390,16 @@ class InputPanel(ctk.CTkFrame):
         self.stiffness_entry.insert(0, str(stiffness))
 
         if use_ratio != self._use_damping_ratio:
+            # The damping entry is overwritten below, so no conversion is needed
             self.damping_type_switch.set("Ratio" if use_ratio else "Coefficient")
-            self._on_damping_type_changed("Ratio" if use_ratio else "Coefficient")
+            self._set_damping_mode(use_ratio)
 
         self.damping_entry.delete(0, "end")
         self.damping_entry.insert(0, str(damping))
 
         self._update_derived_values()
+
+    def destroy(self):
+        """Stop the evaluation worker when the panel is destroyed."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
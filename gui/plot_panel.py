@@ -1,15 +1,118 @@
 """Plot panel with embedded Matplotlib figures."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 import customtkinter as ctk
 import numpy as np
 from numpy.typing import NDArray
 
 import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib import cm
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.ticker import Formatter, Locator, LogLocator
+
+# Dark theme for the panel's figure and axes. It is applied with rc_context()
+# while they are created, leaving matplotlib's global defaults untouched.
+_THEME = {
+    'figure.facecolor': '#2b2b2b',
+    'axes.facecolor': '#1e1e1e',
+    'axes.edgecolor': 'white',
+    'axes.labelcolor': 'white',
+    'axes.titlecolor': 'white',
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'xtick.color': 'white',
+    'ytick.color': 'white',
+}
+
+
+# Curves with more samples than this per pixel column are decimated for display
+_POINTS_PER_PIXEL = 4
+
+
+def _min_max_decimate(
+    x: NDArray[np.floating], y: NDArray[np.floating], n_columns: int
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """Keep the smallest and largest sample of each of ``n_columns`` blocks.
+
+    The kept samples stay in their original order (plus both end points), so
+    the result is a subsequence of the curve that still reaches every extreme
+    a pixel column could show, whatever the axis scale.
+
+    Args:
+        x: Abscissa (N,)
+        y: Ordinates (..., N); leading axes are decimated independently
+        n_columns: Number of blocks, typically the canvas width in pixels
+
+    Returns:
+        Tuple of (x, y) decimated along the last axis
+    """
+    n = y.shape[-1]
+    block = -(-n // n_columns)
+    end = (n // block) * block
+
+    blocks = y[..., :end].reshape(y.shape[:-1] + (-1, block))
+    starts = np.arange(0, end, block)
+    lo = blocks.argmin(axis=-1) + starts
+    hi = blocks.argmax(axis=-1) + starts
+    parts = [np.minimum(lo, hi), np.maximum(lo, hi)]
+
+    if end < n:
+        tail = y[..., end:]
+        tail_lo = tail.argmin(axis=-1) + end
+        tail_hi = tail.argmax(axis=-1) + end
+        parts[0] = np.concatenate([parts[0], np.minimum(tail_lo, tail_hi)[..., None]], axis=-1)
+        parts[1] = np.concatenate([parts[1], np.maximum(tail_lo, tail_hi)[..., None]], axis=-1)
+
+    inner = np.stack(parts, axis=-1).reshape(y.shape[:-1] + (-1,))
+    first = np.zeros(y.shape[:-1] + (1,), dtype=inner.dtype)
+    idx = np.concatenate([first, inner, first + (n - 1)], axis=-1)
+    return x[idx], np.take_along_axis(y, idx, axis=-1)
+
+
+class _DecadeLocator(Locator):
+    """Log-axis tick positions for a linear axis holding log10 of the data."""
+
+    def __init__(self, subs):
+        self._locator = LogLocator(subs=subs)
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    def tick_values(self, vmin, vmax):
+        return np.log10(self._locator.tick_values(10.0 ** vmin, 10.0 ** vmax))
+
+
+class _DecadeFormatter(Formatter):
+    """Label log10 tick positions with the values they stand for.
+
+    Minor ticks are only labelled when less than a decade is in view, where
+    there may be no major tick at all.
+    """
+
+    def __init__(self, minor: bool = False):
+        self._minor = minor
+
+    def __call__(self, x, pos=None):
+        if self._minor:
+            vmin, vmax = self.axis.get_view_interval()
+            if abs(vmax - vmin) >= 1:
+                return ""
+        return f"{10.0 ** x:g}"
+
+    def format_data_short(self, value):
+        return f"{10.0 ** value:.4g}"
+
+
+@lru_cache(maxsize=16)
+def _curve_colors(n_curves: int) -> NDArray[np.floating]:
+    """RGBA colors for ``n_curves`` curves sampled from viridis (read-only)."""
+    colors = cm.viridis(np.linspace(0.2, 0.8, n_curves))
+    colors.flags.writeable = False
+    return colors
 
 
 class PlotPanel(ctk.CTkFrame):
@@ -18,16 +121,33 @@ class PlotPanel(ctk.CTkFrame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
 
+        # Artists of every plot type built so far, keyed by plot type, and
+        # those of the one currently shown
+        self._scenes: dict[str, tuple[dict, dict, dict]] = {}
+        self._mode: Optional[str] = None
+        self._axes: dict = {}
+        self._lines: dict = {}
+        self._texts: dict = {}
+
+        # Figure background without the Bode curves, for blitted updates
+        self._bg = None
+
         self._setup_ui()
 
     def _setup_ui(self):
         """Set up the plot panel UI."""
+        # The Tk backend is only loaded once a plot panel is actually built
+        matplotlib.use('TkAgg')
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
         # Create figure with two subplots (for magnitude and phase)
-        self.figure = Figure(figsize=(8, 6), dpi=100)
-        self.figure.set_facecolor('#2b2b2b')
+        # Constrained layout re-packs the axes on every draw, resizes included,
+        # so no explicit tight_layout() passes are needed
+        with matplotlib.rc_context(_THEME):
+            self.figure = Figure(figsize=(8, 6), dpi=100, layout='constrained')
 
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.figure, master=self)
@@ -42,23 +162,21 @@ class PlotPanel(ctk.CTkFrame):
         self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
         self.toolbar.update()
 
+        # Any full redraw (resize, zoom, pan, new plot) makes the background stale
+        self.canvas.mpl_connect('draw_event', self._invalidate_background)
+
         # Initial empty plot
         self._setup_default_axes()
 
     def _setup_default_axes(self):
+        """Show the empty placeholder plot."""
+        self._use_scene("empty", self._build_default_axes)
+        self.canvas.draw_idle()
+
+    def _build_default_axes(self):
         """Set up default axes configuration."""
-        self.figure.clear()
         ax = self.figure.add_subplot(111)
-        ax.set_facecolor('#1e1e1e')
-        ax.tick_params(colors='white')
-        ax.xaxis.label.set_color('white')
-        ax.yaxis.label.set_color('white')
-        ax.title.set_color('white')
-        for spine in ax.spines.values():
-            spine.set_color('white')
-        ax.set_xlabel("Frequency (Hz)")
-        ax.set_ylabel("Magnitude")
-        ax.grid(True, alpha=0.3)
+        self._style_axis(ax, xlabel="Frequency (Hz)", ylabel="Magnitude")
         ax.text(
             0.5, 0.5,
             "Enter parameters and click Calculate",
@@ -67,22 +185,129 @@ class PlotPanel(ctk.CTkFrame):
             fontsize=12,
             color='gray'
         )
-        self.canvas.draw()
+        self._axes['empty'] = ax
 
     def _style_axis(self, ax, xlabel: str = "", ylabel: str = "", title: str = ""):
-        """Apply consistent styling to an axis."""
-        ax.set_facecolor('#1e1e1e')
-        ax.tick_params(colors='white')
-        ax.xaxis.label.set_color('white')
-        ax.yaxis.label.set_color('white')
-        ax.title.set_color('white')
-        for spine in ax.spines.values():
-            spine.set_color('white')
-        ax.set_xlabel(xlabel)
-        ax.set_ylabel(ylabel)
-        ax.set_title(title)
+        """Label an axis; its other colors come from _THEME when it is built."""
+        ax.set(xlabel=xlabel, ylabel=ylabel, title=title)
+        # Ticks are created lazily at draw time, outside the theme context,
+        # so their style is stored on the axis instead
+        ax.tick_params(which='both', colors='white')
         ax.grid(True, alpha=0.3)
 
+    def _use_scene(self, mode: str, build: Callable[[], None]):
+        """Make the artists for ``mode`` the ones shown in the figure.
+
+        Each plot type's axes are built once and kept in the figure; switching
+        type hides the current axes and shows the other set, and repeated
+        plots of the same type just update the cached artists.
+
+        Hidden axes are also taken out of the layout.
+        """
+        if self._mode == mode:
+            return
+
+        for ax in self._axes.values():
+            ax.set_visible(False)
+            ax.set_in_layout(False)
+
+        scene = self._scenes.get(mode)
+        if scene is None:
+            self._axes, self._lines, self._texts = {}, {}, {}
+            with matplotlib.rc_context(_THEME):
+                build()
+            self._scenes[mode] = (self._axes, self._lines, self._texts)
+        else:
+            self._axes, self._lines, self._texts = scene
+            for ax in self._axes.values():
+                ax.set_visible(True)
+                ax.set_in_layout(True)
+
+        self._mode = mode
+
+    def _decimate(
+        self, x: NDArray[np.floating], y: NDArray[np.floating]
+    ) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+        """Reduce a curve to about two samples per canvas pixel column.
+
+        Only the displayed artists are thinned; the app keeps the full
+        arrays for data export.
+        """
+        columns = self.canvas_widget.winfo_width()
+        # winfo_width() is 1 until the canvas has been mapped
+        if columns <= 1 or y.shape[-1] <= _POINTS_PER_PIXEL * columns:
+            return x, y
+        return _min_max_decimate(x, y, columns)
+
+    def _rescale(self, ax, extra: Optional[NDArray[np.floating]] = None):
+        """Recompute the data limits of an axis from its visible artists."""
+        ax.relim(visible_only=True)
+        if extra is not None:
+            # relim() ignores collections, so their points are passed in here
+            ax.update_datalim(extra)
+        # A toolbar zoom or pan turns autoscaling off on the persistent axes
+        ax.set_autoscale_on(True)
+        ax.autoscale_view()
+
+    def _draw_new_data(self):
+        """Schedule a redraw after new data was plotted.
+
+        The toolbar's home/back/forward views belong to the previous data,
+        so its navigation history is reset as well.
+        """
+        self.toolbar.update()
+        self.canvas.draw_idle()
+
+    @staticmethod
+    def _set_vline(line, x: Optional[float]):
+        """Move a vertical marker line, hiding it when there is no position."""
+        if x is not None:
+            line.set_xdata([x, x])
+        line.set_visible(x is not None)
+
+    def _invalidate_background(self, event=None):
+        """Drop the cached blit background."""
+        self._bg = None
+
+    def _capture_background(self):
+        """Render the figure without the Bode curves and keep the pixels."""
+        curves = (self._lines['mag'], self._lines['phase'])
+        for line in curves:
+            line.set_visible(False)
+        # Unlike the plot methods, this needs the pixels now, so no draw_idle()
+        self.canvas.draw()
+        self._bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        for line in curves:
+            line.set_visible(True)
+
+    def _build_frequency_response(self):
+        """Create the magnitude and phase axes of the Bode plot."""
+        ax1 = self.figure.add_subplot(211)
+        self._style_axis(ax1, ylabel="Magnitude (dB)", title="Frequency Response")
+
+        # The curves are plotted against log10(f) on a linear axis, which
+        # skips the per-vertex log transform; the ticks still read in Hz.
+        # The phase axis shares these tickers through sharex.
+        ax1.xaxis.set_major_locator(_DecadeLocator(subs=(1.0,)))
+        ax1.xaxis.set_minor_locator(_DecadeLocator(subs=np.arange(2, 10)))
+        ax1.xaxis.set_major_formatter(_DecadeFormatter())
+        ax1.xaxis.set_minor_formatter(_DecadeFormatter(minor=True))
+        self._lines['mag'], = ax1.plot([], [], 'c-', linewidth=1.5)
+        self._lines['fn_mag'] = ax1.axvline(0.0, color='r', linestyle='--', alpha=0.7)
+        self._texts['legend'] = ax1.legend(
+            [self._lines['fn_mag']], [''],
+            loc='upper right', facecolor='#2b2b2b', labelcolor='white'
+        )
+
+        ax2 = self.figure.add_subplot(212, sharex=ax1)
+        self._style_axis(ax2, xlabel="Frequency (Hz)", ylabel="Phase (deg)")
+        self._lines['phase'], = ax2.plot([], [], 'c-', linewidth=1.5)
+        self._lines['fn_phase'] = ax2.axvline(0.0, color='r', linestyle='--', alpha=0.7)
+        ax2.set_yticks([-180, -135, -90, -45, 0])
+
+        self._axes['mag'] = ax1
+        self._axes['phase'] = ax2
+
     def plot_frequency_response(
         self,
         frequencies: NDArray[np.floating],
@@ -98,29 +323,70 @@ class PlotPanel(ctk.CTkFrame):
             phase_deg: Phase in degrees
             natural_freq_hz: Natural frequency for vertical line marker
         """
-        self.figure.clear()
+        self._use_scene("frequency", self._build_frequency_response)
 
-        # Magnitude plot
-        ax1 = self.figure.add_subplot(211)
-        self._style_axis(ax1, ylabel="Magnitude (dB)", title="Frequency Response")
-        ax1.semilogx(frequencies, magnitude_db, 'c-', linewidth=1.5)
+        log_freq = np.log10(frequencies)
+        self._lines['mag'].set_data(*self._decimate(log_freq, magnitude_db))
+        self._lines['phase'].set_data(*self._decimate(log_freq, phase_deg))
 
+        fn_x = np.log10(natural_freq_hz) if natural_freq_hz else None
+        self._set_vline(self._lines['fn_mag'], fn_x)
+        self._set_vline(self._lines['fn_phase'], fn_x)
+        legend = self._texts['legend']
         if natural_freq_hz:
-            ax1.axvline(natural_freq_hz, color='r', linestyle='--', alpha=0.7, label=f'fn = {natural_freq_hz:.2f} Hz')
-            ax1.legend(loc='upper right', facecolor='#2b2b2b', labelcolor='white')
+            legend.get_texts()[0].set_text(f'fn = {natural_freq_hz:.2f} Hz')
+        legend.set_visible(bool(natural_freq_hz))
 
-        # Phase plot
-        ax2 = self.figure.add_subplot(212, sharex=ax1)
-        self._style_axis(ax2, xlabel="Frequency (Hz)", ylabel="Phase (deg)")
-        ax2.semilogx(frequencies, phase_deg, 'c-', linewidth=1.5)
+        self._rescale(self._axes['mag'])
+        self._rescale(self._axes['phase'])
+        self._draw_new_data()
 
-        if natural_freq_hz:
-            ax2.axvline(natural_freq_hz, color='r', linestyle='--', alpha=0.7)
+    def update_frequency_response_fast(
+        self,
+        frequencies: NDArray[np.floating],
+        magnitude_db: NDArray[np.floating],
+        phase_deg: NDArray[np.floating]
+    ):
+        """Replace the Bode curves by blitting only the two lines.
 
-        ax2.set_yticks([-180, -135, -90, -45, 0])
+        Intended for parameter sweeps: axis limits, labels and markers are
+        left as they are, so only the curves are re-rasterized. Falls back
+        to a full plot if no frequency response is shown yet.
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+        Args:
+            frequencies: Frequency array in Hz
+            magnitude_db: Magnitude in dB
+            phase_deg: Phase in degrees
+        """
+        if self._mode != "frequency":
+            self.plot_frequency_response(frequencies, magnitude_db, phase_deg)
+            return
+
+        if self._bg is None:
+            self._capture_background()
+
+        mag, phase = self._lines['mag'], self._lines['phase']
+        log_freq = np.log10(frequencies)
+        mag.set_data(*self._decimate(log_freq, magnitude_db))
+        phase.set_data(*self._decimate(log_freq, phase_deg))
+
+        self.canvas.restore_region(self._bg)
+        self._axes['mag'].draw_artist(mag)
+        self._axes['phase'].draw_artist(phase)
+        self.canvas.blit(self.figure.bbox)
+
+    def _build_transmissibility(self):
+        """Create the axis and artists for a single transmissibility curve."""
+        ax = self.figure.add_subplot(111)
+        self._style_axis(ax, xlabel="Frequency (Hz)", ylabel="Transmissibility", title="Transmissibility")
+        ax.set_yscale('log')
+        self._lines['tr'], = ax.plot([], [], 'c-', linewidth=1.5)
+        self._texts['legend'] = ax.legend(
+            [self._lines['tr']], [''],
+            loc='upper right', facecolor='#2b2b2b', labelcolor='white'
+        )
+        self._build_transmissibility_references(ax)
+        self._axes['tr'] = ax
 
     def plot_transmissibility(
         self,
@@ -139,38 +405,121 @@ class PlotPanel(ctk.CTkFrame):
             natural_freq_hz: Natural frequency for reference
             multi_zeta: Optional list of (zeta, TR) tuples for multiple curves
         """
-        self.figure.clear()
+        if multi_zeta:
+            zetas = np.array([z for z, _ in multi_zeta])
+            curves = np.vstack([tr for _, tr in multi_zeta])
+            self.plot_transmissibility_batch(frequencies, zetas, curves, natural_freq_hz)
+            return
+
+        self._use_scene("transmissibility", self._build_transmissibility)
 
+        self._lines['tr'].set_data(*self._decimate(frequencies, transmissibility))
+        self._texts['legend'].get_texts()[0].set_text(f'ζ = {zeta:.3f}')
+        self._update_transmissibility_references(natural_freq_hz)
+
+        self._rescale(self._axes['tr'])
+        self._draw_new_data()
+
+    def _build_transmissibility_batch(self):
+        """Create the axis and line collection for several TR curves."""
         ax = self.figure.add_subplot(111)
         self._style_axis(ax, xlabel="Frequency (Hz)", ylabel="Transmissibility", title="Transmissibility")
+        ax.set_yscale('log')
+        self._lines['curves'] = LineCollection([], linewidths=1.5)
+        ax.add_collection(self._lines['curves'], autolim=False)
+        self._texts['zetas'] = None
+        self._build_transmissibility_references(ax)
+        self._axes['tr'] = ax
+
+    def plot_transmissibility_batch(
+        self,
+        frequencies: NDArray[np.floating],
+        zetas: NDArray[np.floating],
+        transmissibility: NDArray[np.floating],
+        natural_freq_hz: Optional[float] = None
+    ):
+        """Plot transmissibility curves for several damping ratios.
 
-        if multi_zeta:
-            colors = plt.cm.viridis(np.linspace(0.2, 0.8, len(multi_zeta)))
-            for (z, tr), color in zip(multi_zeta, colors):
-                ax.semilogy(frequencies, tr, color=color, linewidth=1.5, label=f'ζ = {z:.2f}')
-            ax.legend(loc='upper right', facecolor='#2b2b2b', labelcolor='white')
-        else:
-            ax.semilogy(frequencies, transmissibility, 'c-', linewidth=1.5, label=f'ζ = {zeta:.3f}')
-            ax.legend(loc='upper right', facecolor='#2b2b2b', labelcolor='white')
+        All curves are drawn by a single LineCollection instead of one
+        Line2D per damping ratio.
 
+        Args:
+            frequencies: Frequency array in Hz (N,)
+            zetas: Damping ratios (M,)
+            transmissibility: TR values, one row per damping ratio (M, N)
+            natural_freq_hz: Natural frequency for reference
+        """
+        self._use_scene("transmissibility_batch", self._build_transmissibility_batch)
+        ax = self._axes['tr']
+
+        x, transmissibility = self._decimate(frequencies, transmissibility)
+        segments = np.empty(transmissibility.shape + (2,), dtype=transmissibility.dtype)
+        segments[..., 0] = x
+        segments[..., 1] = transmissibility
+
+        self._lines['curves'].set_segments(segments)
+
+        # Colors and legend only depend on the damping ratios, which rarely change
+        zeta_key = tuple(np.asarray(zetas).tolist())
+        if zeta_key != self._texts['zetas']:
+            colors = _curve_colors(len(zeta_key))
+            self._lines['curves'].set_color(colors)
+
+            # The collection has a single legend entry, so label each curve with a proxy
+            handles = [Line2D([], [], color=color, linewidth=1.5) for color in colors]
+            ax.legend(
+                handles, [f'ζ = {z:.2f}' for z in zeta_key],
+                loc='upper right', facecolor='#2b2b2b', labelcolor='white'
+            )
+            self._texts['zetas'] = zeta_key
+
+        self._update_transmissibility_references(natural_freq_hz)
+
+        self._rescale(ax, segments.reshape(-1, 2))
+        self._draw_new_data()
+
+    def _build_transmissibility_references(self, ax):
+        """Create the TR = 1 line and the isolation-region marker."""
         # TR = 1 reference line
         ax.axhline(1.0, color='yellow', linestyle='--', alpha=0.5, label='TR = 1')
 
+        # Isolation starts at sqrt(2) * fn; positioned by the update below
+        self._lines['isolation'] = ax.axvline(1.0, color='r', linestyle=':', alpha=0.7)
+        self._texts['isolation'] = ax.annotate(
+            '',
+            xy=(1.0, 1),
+            xytext=(1.5, 2),
+            arrowprops=dict(arrowstyle='->', color='white', alpha=0.7),
+            color='white',
+            fontsize=9
+        )
+
+    def _update_transmissibility_references(self, natural_freq_hz: Optional[float]):
+        """Move the isolation-region marker to sqrt(2) * fn."""
+        annotation = self._texts['isolation']
         if natural_freq_hz:
-            # Isolation starts at sqrt(2) * fn
             isolation_start = np.sqrt(2) * natural_freq_hz
-            ax.axvline(isolation_start, color='r', linestyle=':', alpha=0.7)
-            ax.annotate(
-                f'Isolation starts\n({isolation_start:.1f} Hz)',
-                xy=(isolation_start, 1),
-                xytext=(isolation_start * 1.5, 2),
-                arrowprops=dict(arrowstyle='->', color='white', alpha=0.7),
-                color='white',
-                fontsize=9
-            )
+            annotation.xy = (isolation_start, 1)
+            annotation.set_position((isolation_start * 1.5, 2))
+            annotation.set_text(f'Isolation starts\n({isolation_start:.1f} Hz)')
+        else:
+            isolation_start = None
+        self._set_vline(self._lines['isolation'], isolation_start)
+        annotation.set_visible(bool(natural_freq_hz))
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+    def _build_time_response(self):
+        """Create the axis and artists for a time-domain response."""
+        ax = self.figure.add_subplot(111)
+        self._style_axis(ax, xlabel="Time (s)", ylabel="Displacement (m)")
+        self._lines['response'], = ax.plot([], [], 'c-', linewidth=1.5)
+        self._lines['env_upper'], = ax.plot([], [], 'r--', linewidth=1, alpha=0.7)
+        self._lines['env_lower'], = ax.plot([], [], 'r--', linewidth=1, alpha=0.7)
+        self._texts['legend'] = ax.legend(
+            [self._lines['response'], self._lines['env_upper']], ['Response', 'Decay envelope'],
+            loc='upper right', facecolor='#2b2b2b', labelcolor='white'
+        )
+        ax.axhline(0, color='white', linewidth=0.5, alpha=0.3)
+        self._axes['time'] = ax
 
     def plot_time_response(
         self,
@@ -187,22 +536,40 @@ class PlotPanel(ctk.CTkFrame):
             response_type: Type of response for title
             envelope: Optional decay envelope to overlay
         """
-        self.figure.clear()
-
+        self._use_scene("time", self._build_time_response)
+        ax = self._axes['time']
+        ax.set_title(response_type)
+
+        self._lines['response'].set_data(*self._decimate(time, displacement))
+
+        has_envelope = envelope is not None
+        if has_envelope:
+            env_time, envelope = self._decimate(time, envelope)
+            self._lines['env_upper'].set_data(env_time, envelope)
+            self._lines['env_lower'].set_data(env_time, -envelope)
+        self._lines['env_upper'].set_visible(has_envelope)
+        self._lines['env_lower'].set_visible(has_envelope)
+        self._texts['legend'].set_visible(has_envelope)
+
+        self._rescale(ax)
+        self._draw_new_data()
+
+    def _build_harmonic_response(self):
+        """Create the axis and artists for a harmonic response."""
         ax = self.figure.add_subplot(111)
-        self._style_axis(ax, xlabel="Time (s)", ylabel="Displacement (m)", title=response_type)
-
-        ax.plot(time, displacement, 'c-', linewidth=1.5, label='Response')
-
-        if envelope is not None:
-            ax.plot(time, envelope, 'r--', linewidth=1, alpha=0.7, label='Decay envelope')
-            ax.plot(time, -envelope, 'r--', linewidth=1, alpha=0.7)
-            ax.legend(loc='upper right', facecolor='#2b2b2b', labelcolor='white')
+        self._style_axis(ax, xlabel="Time (s)", ylabel="Displacement (m)")
+        self._lines['response'], = ax.plot([], [], 'c-', linewidth=1.5)
 
+        # Steady-state amplitude lines
+        self._lines['ss_upper'] = ax.axhline(1.0, color='r', linestyle='--', alpha=0.5)
+        self._lines['ss_lower'] = ax.axhline(-1.0, color='r', linestyle='--', alpha=0.5)
         ax.axhline(0, color='white', linewidth=0.5, alpha=0.3)
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._texts['legend'] = ax.legend(
+            [self._lines['ss_upper']], [''],
+            loc='upper right', facecolor='#2b2b2b', labelcolor='white'
+        )
+        self._axes['time'] = ax
 
     def plot_harmonic_response(
         self,
@@ -219,27 +586,17 @@ class PlotPanel(ctk.CTkFrame):
             excitation_freq: Excitation frequency in Hz
             steady_state_amplitude: Steady-state amplitude for reference
         """
-        self.figure.clear()
-
-        ax = self.figure.add_subplot(111)
-        self._style_axis(
-            ax,
-            xlabel="Time (s)",
-            ylabel="Displacement (m)",
-            title=f"Harmonic Response (f = {excitation_freq:.2f} Hz)"
-        )
+        self._use_scene("harmonic", self._build_harmonic_response)
+        ax = self._axes['time']
+        ax.set_title(f"Harmonic Response (f = {excitation_freq:.2f} Hz)")
 
-        ax.plot(time, displacement, 'c-', linewidth=1.5)
+        self._lines['response'].set_data(*self._decimate(time, displacement))
+        self._lines['ss_upper'].set_ydata([steady_state_amplitude, steady_state_amplitude])
+        self._lines['ss_lower'].set_ydata([-steady_state_amplitude, -steady_state_amplitude])
+        self._texts['legend'].get_texts()[0].set_text(f'Steady-state: ±{steady_state_amplitude:.4g} m')
 
-        # Steady-state amplitude lines
-        ax.axhline(steady_state_amplitude, color='r', linestyle='--', alpha=0.5, label=f'Steady-state: ±{steady_state_amplitude:.4g} m')
-        ax.axhline(-steady_state_amplitude, color='r', linestyle='--', alpha=0.5)
-        ax.axhline(0, color='white', linewidth=0.5, alpha=0.3)
-
-        ax.legend(loc='upper right', facecolor='#2b2b2b', labelcolor='white')
-
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._rescale(ax)
+        self._draw_new_data()
 
     def get_figure(self) -> Figure:
         """Get the matplotlib figure for export.
@@ -2,13 +2,67 @@
 """SDOF Vibration Analysis Tool - Entry Point."""
 
 import sys
+import tkinter as tk
 from pathlib import Path
+from typing import Callable, Optional
 
 # Add project root to path for imports
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from gui.app import run
+
+def _boot() -> Optional[Callable[[], None]]:
+    """Show a loading window while the GUI and its dependencies are imported.
+
+    customtkinter, matplotlib, numpy and scipy take a while to import, so
+    a plain Tk window is shown first and the application module is loaded
+    from its event loop.
+
+    Returns:
+        The application's run function, or None if the loading window was
+        closed before loading finished
+
+    Raises:
+        Exception: Whatever importing the application raised
+    """
+    splash = tk.Tk()
+    splash.title("SDOF Vibration Analysis Tool")
+    splash.configure(bg="#2b2b2b")
+    tk.Label(
+        splash,
+        text="Loading...",
+        bg="#2b2b2b",
+        fg="white",
+        padx=60,
+        pady=30
+    ).pack()
+
+    loaded = []
+    errors = []
+
+    def finish_boot():
+        try:
+            from gui.app import run as run_app
+            loaded.append(run_app)
+        except Exception as e:
+            # Tk would only print this from its callback handler
+            errors.append(e)
+        finally:
+            splash.destroy()
+
+    splash.after(50, finish_boot)
+    splash.mainloop()
+
+    if errors:
+        raise errors[0]
+    return loaded[0] if loaded else None
+
+
+def run():
+    """Load the application behind a splash window and run it."""
+    run_app = _boot()
+    if run_app is not None:
+        run_app()
 
 
 if __name__ == "__main__":
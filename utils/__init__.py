@@ -1,7 +1,7 @@
 """Utility modules for SDOF vibration tool."""
 
 from .validators import validate_positive, validate_non_negative, validate_range, ValidationError
-from .export import export_plot, export_data
+from .export import export_plot, export_data, export_data_parquet, export_data_feather, export_arrow_ipc, export_all
 
 __all__ = [
     "validate_positive",
@@ -10,4 +10,8 @@ __all__ = [
     "ValidationError",
     "export_plot",
     "export_data",
+    "export_data_parquet",
+    "export_data_feather",
+    "export_arrow_ipc",
+    "export_all",
 ]
@@ -1,14 +1,112 @@
 """Export utilities for plots and data."""
 
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 from datetime import datetime
 
 import numpy as np
 from numpy.typing import NDArray
+import matplotlib
 from matplotlib.figure import Figure
 
+# Image formats rendered through Agg
+_RASTER_SUFFIXES = {'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.webp'}
+
+# Resolution-independent formats
+_VECTOR_SUFFIXES = {'.svg', '.svgz', '.pdf', '.eps', '.ps'}
+
+# Cells converted per writerows() call; like pandas' to_csv the row count of
+# a chunk scales inversely with the number of columns, bounding its memory
+_CSV_CHUNK_CELLS = 100_000
+
+# Buffer size for CSV output; 1 MiB keeps large exports to few write() calls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _column_cells(values: NDArray) -> list:
+    """Convert a column to the cells the CSV writer receives.
+
+    Every float is written as the shortest text that reads back to the same
+    value at the column's precision: float64 becomes Python floats (written
+    via repr), narrower floats are formatted by numpy in one vectorized pass
+    so float32 data is not padded out to float64 digits. Other columns are
+    passed through as Python scalars.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'f' and values.dtype.itemsize < 8:
+        return values.astype(str).tolist()
+    return values.tolist()
+
+
+def _write_metadata_header(f, metadata: dict, timestamp: Optional[datetime]) -> None:
+    """Write metadata as CSV comment lines in one writelines() call."""
+    generated = (timestamp or datetime.now()).isoformat()
+    items = tuple((str(key), str(value)) for key, value in metadata.items())
+    f.writelines([
+        "# SDOF Vibration Analysis Export\n",
+        f"# Generated: {generated}\n",
+        _format_metadata(items),
+        "#\n",
+    ])
+
+
+@lru_cache(maxsize=128)
+def _format_metadata(items: tuple[tuple[str, str], ...]) -> str:
+    """Comment block for the metadata items, cached for repeated parameter sets.
+
+    The items keep the caller's order, which is the order they are written in.
+    """
+    return "".join(f"# {key}: {value}\n" for key, value in items)
+
+
+def _write_float_rows(f, arrays: list[NDArray], chunk_rows: int, lineterminator: str) -> None:
+    """Write all-float columns as CSV rows with one printf-style format.
+
+    Floats never need quoting, so each row is rendered by a single ``%``
+    against a precomputed row format instead of going through csv.writer
+    cell by cell.
+    """
+    row_format = ','.join(['%s'] * len(arrays)) + lineterminator
+    n_rows = len(arrays[0])
+
+    for start in range(0, n_rows, chunk_rows):
+        stop = start + chunk_rows
+        rows = zip(*(_column_cells(arr[start:stop]) for arr in arrays))
+        f.write(''.join(map(row_format.__mod__, rows)))
+
+
+def _raster_save_options(figure: Figure, suffix: str, dpi: int) -> dict:
+    """savefig() keywords for an image format rendered through Agg."""
+    options = {'dpi': dpi}
+
+    if suffix == '.png':
+        # zlib level 1 encodes several times faster for slightly larger files
+        options['pil_kwargs'] = {'compress_level': 1}
+
+    if figure.get_layout_engine() is None:
+        options['bbox_inches'] = 'tight'
+        get_renderer = getattr(figure.canvas, 'get_renderer', None)
+        if suffix in _RASTER_SUFFIXES and get_renderer is not None:
+            # bbox_inches='tight' makes savefig render the figure once just to
+            # measure it; measure with the canvas' existing renderer instead
+            pad = matplotlib.rcParams['savefig.pad_inches']
+            options['bbox_inches'] = figure.get_tightbbox(get_renderer()).padded(pad)
+
+    return options
+
+
+def _vector_save_options(figure: Figure) -> dict:
+    """savefig() keywords for a vector format (SVG, PDF, EPS).
+
+    The output is resolution independent, so no dpi is passed.
+    """
+    if figure.get_layout_engine() is not None:
+        return {}
+    return {'bbox_inches': 'tight'}
+
 
 def export_plot(
     figure: Figure,
@@ -18,10 +116,15 @@ def export_plot(
 ) -> Path:
     """Export a matplotlib figure to an image file.
 
+    Figures with a layout engine (e.g. ``layout='constrained'``) already fit
+    their artists to the canvas and are saved as-is; others are cropped
+    with ``bbox_inches='tight'``, which costs an extra measuring pass, so
+    callers should prefer constrained layout.
+
     Args:
         figure: Matplotlib figure to export
         filepath: Output file path (extension determines format)
-        dpi: Resolution in dots per inch
+        dpi: Resolution in dots per inch (raster formats only)
         transparent: Whether to use transparent background
 
     Returns:
@@ -30,43 +133,183 @@ def export_plot(
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
+    suffix = filepath.suffix.lower()
+    if suffix in _VECTOR_SUFFIXES:
+        options = _vector_save_options(figure)
+    else:
+        options = _raster_save_options(figure, suffix, dpi)
+
     figure.savefig(
         filepath,
-        dpi=dpi,
-        bbox_inches='tight',
         transparent=transparent,
-        facecolor='white' if not transparent else 'none'
+        facecolor='white' if not transparent else 'none',
+        **options
     )
 
     return filepath
 
 
+def _arrow_table(
+    columns: dict[str, NDArray],
+    metadata: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
+):
+    """Build a pyarrow Table from the columns, with metadata in its schema.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Parquet, Feather and Arrow export require pyarrow (pip install pyarrow)"
+        ) from e
+
+    table = pa.Table.from_pydict({name: np.asarray(values) for name, values in columns.items()})
+
+    if metadata:
+        schema_metadata = {"Generated": (timestamp or datetime.now()).isoformat()}
+        schema_metadata.update((str(key), str(value)) for key, value in metadata.items())
+        table = table.replace_schema_metadata(schema_metadata)
+
+    return table
+
+
+def export_data_parquet(
+    filepath: Union[str, Path],
+    columns: dict[str, NDArray],
+    metadata: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
+) -> Path:
+    """Export numerical data to a zstd-compressed Parquet file.
+
+    Requires the optional pyarrow dependency.
+
+    Args:
+        filepath: Output file path
+        columns: Dictionary of column_name -> data_array
+        metadata: Optional metadata stored in the file's schema
+        timestamp: Generation time to record (defaults to now); pass the
+            same value to stamp a batch of exports consistently
+
+    Returns:
+        Path to exported file
+    """
+    table = _arrow_table(columns, metadata, timestamp)
+    import pyarrow.parquet as pq
+
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    pq.write_table(table, filepath, compression='zstd')
+
+    return filepath
+
+
+def export_data_feather(
+    filepath: Union[str, Path],
+    columns: dict[str, NDArray],
+    metadata: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
+) -> Path:
+    """Export numerical data to an lz4-compressed Feather (Arrow) file.
+
+    Requires the optional pyarrow dependency.
+
+    Args:
+        filepath: Output file path
+        columns: Dictionary of column_name -> data_array
+        metadata: Optional metadata stored in the file's schema
+        timestamp: Generation time to record (defaults to now); pass the
+            same value to stamp a batch of exports consistently
+
+    Returns:
+        Path to exported file
+    """
+    table = _arrow_table(columns, metadata, timestamp)
+    from pyarrow import feather
+
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    feather.write_feather(table, filepath, compression='lz4')
+
+    return filepath
+
+
+def export_arrow_ipc(
+    filepath: Union[str, Path],
+    columns: dict[str, NDArray],
+    metadata: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
+) -> Path:
+    """Export numerical data to an uncompressed Arrow IPC file.
+
+    Numeric columns are wrapped without copying and written as-is, so a
+    consumer can memory-map the file with ``pyarrow.ipc.open_file`` and
+    read the columns without a parse step. Requires the optional pyarrow
+    dependency.
+
+    Args:
+        filepath: Output file path
+        columns: Dictionary of column_name -> data_array
+        metadata: Optional metadata stored in the file's schema
+        timestamp: Generation time to record (defaults to now); pass the
+            same value to stamp a batch of exports consistently
+
+    Returns:
+        Path to exported file
+    """
+    table = _arrow_table(columns, metadata, timestamp)
+    import pyarrow as pa
+
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    with pa.OSFile(str(filepath), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    return filepath
+
+
 def export_data(
     filepath: Union[str, Path],
     columns: dict[str, NDArray],
-    metadata: Optional[dict] = None
+    metadata: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
 ) -> Path:
     """Export numerical data to CSV file.
 
+    A ``.parquet``, ``.feather`` or ``.arrow`` extension writes that binary
+    format instead (requires pyarrow).
+
     Args:
         filepath: Output file path
         columns: Dictionary of column_name -> data_array
         metadata: Optional metadata to include as comments
+        timestamp: Generation time to record (defaults to now); pass the
+            same value to stamp a batch of exports consistently
 
     Returns:
         Path to exported file
     """
     filepath = Path(filepath)
+
+    suffix = filepath.suffix.lower()
+    if suffix == '.parquet':
+        return export_data_parquet(filepath, columns, metadata, timestamp)
+    if suffix == '.feather':
+        return export_data_feather(filepath, columns, metadata, timestamp)
+    if suffix == '.arrow':
+        return export_arrow_ipc(filepath, columns, metadata, timestamp)
+
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(filepath, 'w', newline='') as f:
-        # Write metadata as comments
+    with open(filepath, 'w', newline='', buffering=_WRITE_BUFFER_SIZE, encoding='utf-8') as f:
         if metadata:
-            f.write(f"# SDOF Vibration Analysis Export\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n")
-            for key, value in metadata.items():
-                f.write(f"# {key}: {value}\n")
-            f.write("#\n")
+            _write_metadata_header(f, metadata, timestamp)
 
         # Write CSV data
         writer = csv.writer(f)
@@ -75,23 +318,70 @@ def export_data(
         headers = list(columns.keys())
         writer.writerow(headers)
 
-        # Data rows
+        # Data rows, converted column-wise and written in chunks. zip()
+        # recycles its row tuple once writerows() has consumed it, so no
+        # per-row objects are allocated beyond the cells themselves.
         arrays = [columns[h] for h in headers]
         n_rows = len(arrays[0])
+        chunk_rows = max(1, _CSV_CHUNK_CELLS // len(arrays))
 
-        for i in range(n_rows):
-            row = [arr[i] for arr in arrays]
-            writer.writerow(row)
+        if all(np.asarray(arr).dtype.kind == 'f' for arr in arrays):
+            _write_float_rows(f, arrays, chunk_rows, writer.dialect.lineterminator)
+            return filepath
+
+        for start in range(0, n_rows, chunk_rows):
+            stop = start + chunk_rows
+            writer.writerows(zip(*(_column_cells(arr[start:stop]) for arr in arrays)))
 
     return filepath
 
 
+def export_all(
+    filepath_stem: Union[str, Path],
+    datasets: dict[str, dict],
+    extension: str = "csv"
+) -> list[Path]:
+    """Export several datasets side by side, writing them concurrently.
+
+    Each dataset goes to ``<stem>_<name>.<extension>`` through export_data.
+    All files share one generation timestamp. They are written on a thread
+    pool, which overlaps file I/O and the pyarrow encoders; CSV cell
+    formatting holds the GIL, so it still runs one file at a time.
+
+    Args:
+        filepath_stem: Output path without extension, e.g. ``out/run1``
+        datasets: Dictionary of name -> {"columns": ..., "metadata": ...};
+            "metadata" is optional
+        extension: File extension, which selects the format as in export_data
+
+    Returns:
+        Paths to the exported files, in the order of datasets
+    """
+    filepath_stem = Path(filepath_stem)
+    timestamp = datetime.now()
+    filepath_stem.parent.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(datasets), 4))) as executor:
+        futures = [
+            executor.submit(
+                export_data,
+                filepath_stem.with_name(f"{filepath_stem.name}_{name}.{extension}"),
+                dataset["columns"],
+                dataset.get("metadata"),
+                timestamp,
+            )
+            for name, dataset in datasets.items()
+        ]
+        return [future.result() for future in futures]
+
+
 def export_frequency_response(
     filepath: Union[str, Path],
     frequencies: NDArray[np.floating],
     magnitude_db: NDArray[np.floating],
     phase_deg: NDArray[np.floating],
-    system_info: Optional[dict] = None
+    system_info: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
 ) -> Path:
     """Export frequency response data.
 
@@ -101,6 +391,7 @@ def export_frequency_response(
         magnitude_db: Magnitude in dB
         phase_deg: Phase in degrees
         system_info: System parameters for metadata
+        timestamp: Generation time to record (defaults to now)
 
     Returns:
         Path to exported file
@@ -115,7 +406,8 @@ def export_frequency_response(
             "Magnitude (dB)": magnitude_db,
             "Phase (deg)": phase_deg,
         },
-        metadata=metadata
+        metadata=metadata,
+        timestamp=timestamp
     )
 
 
@@ -123,7 +415,8 @@ def export_transmissibility(
     filepath: Union[str, Path],
     frequencies: NDArray[np.floating],
     transmissibility: NDArray[np.floating],
-    system_info: Optional[dict] = None
+    system_info: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
 ) -> Path:
     """Export transmissibility data.
 
@@ -132,6 +425,7 @@ def export_transmissibility(
         frequencies: Frequency array in Hz
         transmissibility: TR values
         system_info: System parameters for metadata
+        timestamp: Generation time to record (defaults to now)
 
     Returns:
         Path to exported file
@@ -139,14 +433,19 @@ def export_transmissibility(
     metadata = system_info or {}
     metadata["Analysis Type"] = "Transmissibility"
 
+    # 20*log10(TR) computed into a single buffer
+    transmissibility_db = np.log10(transmissibility)
+    transmissibility_db *= 20.0
+
     return export_data(
         filepath,
         columns={
             "Frequency (Hz)": frequencies,
             "Transmissibility": transmissibility,
-            "Transmissibility (dB)": 20 * np.log10(transmissibility),
+            "Transmissibility (dB)": transmissibility_db,
         },
-        metadata=metadata
+        metadata=metadata,
+        timestamp=timestamp
     )
 
 
@@ -155,7 +454,8 @@ def export_time_response(
     time: NDArray[np.floating],
     displacement: NDArray[np.floating],
     response_type: str = "Time Response",
-    system_info: Optional[dict] = None
+    system_info: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
 ) -> Path:
     """Export time response data.
 
@@ -165,6 +465,7 @@ def export_time_response(
         displacement: Displacement array
         response_type: Type of response for metadata
         system_info: System parameters for metadata
+        timestamp: Generation time to record (defaults to now)
 
     Returns:
         Path to exported file
@@ -178,22 +479,25 @@ def export_time_response(
             "Time (s)": time,
             "Displacement (m)": displacement,
         },
-        metadata=metadata
+        metadata=metadata,
+        timestamp=timestamp
     )
 
 
 def generate_export_filename(
     analysis_type: str,
-    extension: str = "csv"
+    extension: str = "csv",
+    timestamp: Optional[datetime] = None
 ) -> str:
     """Generate a timestamped filename for export.
 
     Args:
         analysis_type: Type of analysis (e.g., "frf", "transmissibility")
         extension: File extension
+        timestamp: Time to encode in the name (defaults to now)
 
     Returns:
         Generated filename
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"sdof_{analysis_type}_{timestamp}.{extension}"
+    stamp = (timestamp or datetime.now()).strftime("%Y%m%d_%H%M%S")
+    return f"sdof_{analysis_type}_{stamp}.{extension}"
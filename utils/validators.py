@@ -1,7 +1,16 @@
 """Input validation utilities."""
 
+import math
+import re
 from typing import Optional
 
+# Plain decimal or scientific notation; the only number syntax parse_float accepts
+_FLOAT_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+# Allowed number of points in a frequency sweep
+_MIN_FREQ_POINTS = 10
+_MAX_FREQ_POINTS = 100000
+
 
 class ValidationError(Exception):
     """Raised when input validation fails."""
@@ -66,8 +75,27 @@ def validate_range(
         Validated value
 
     Raises:
-        ValidationError: If value is outside range
+        ValidationError: If value is outside range (or NaN)
     """
+    # Bit 0: above max, bit 1: below min, bit 2: NaN (fails every bound).
+    # All checks are packed into one status so the valid path branches once.
+    above = 0 if max_val is None else (value > max_val if max_inclusive else value >= max_val)
+    below = 0 if min_val is None else (value < min_val if min_inclusive else value <= min_val)
+    status = above | below << 1 | (value != value) << 2
+    if status:
+        _raise_range_error(value, name, min_val, max_val, min_inclusive, max_inclusive)
+    return value
+
+
+def _raise_range_error(
+    value: float,
+    name: str,
+    min_val: Optional[float],
+    max_val: Optional[float],
+    min_inclusive: bool,
+    max_inclusive: bool
+):
+    """Raise the ValidationError describing which range bound was violated."""
     if min_val is not None:
         if min_inclusive and value < min_val:
             raise ValidationError(f"{name} must be >= {min_val} (got {value})")
@@ -80,7 +108,7 @@ def validate_range(
         elif not max_inclusive and value >= max_val:
             raise ValidationError(f"{name} must be < {max_val} (got {value})")
 
-    return value
+    raise ValidationError(f"{name} must be a number (got {value})")
 
 
 def parse_float(text: str, name: str) -> float:
@@ -100,10 +128,10 @@ def parse_float(text: str, name: str) -> float:
     if not text:
         raise ValidationError(f"{name} cannot be empty")
 
-    try:
-        return float(text)
-    except ValueError:
+    # Screen the text first so float() only ever sees valid input
+    if _FLOAT_RE.fullmatch(text) is None:
         raise ValidationError(f"{name} must be a valid number (got '{text}')")
+    return float(text)
 
 
 def validate_system_parameters(
@@ -155,18 +183,33 @@ def validate_frequency_range(
     Raises:
         ValidationError: If parameters are invalid
     """
-    f_min = validate_positive(f_min, "Minimum frequency")
-    f_max = validate_positive(f_max, "Maximum frequency")
+    span = f_max - f_min
+    if not (
+        f_min > 0 and span > 0 and math.isfinite(span)
+        and _MIN_FREQ_POINTS <= n_points <= _MAX_FREQ_POINTS
+    ):
+        _raise_frequency_range_error(f_min, f_max, n_points)
+    return f_min, f_max, n_points
+
 
-    if f_max <= f_min:
+def _raise_frequency_range_error(f_min: float, f_max: float, n_points: int):
+    """Raise the ValidationError describing what is wrong with a frequency range."""
+    validate_positive(f_min, "Minimum frequency")
+    validate_positive(f_max, "Maximum frequency")
+
+    if not f_max > f_min:
         raise ValidationError(
             f"Maximum frequency ({f_max}) must be greater than minimum ({f_min})"
         )
 
-    if n_points < 10:
-        raise ValidationError(f"Number of points must be at least 10 (got {n_points})")
+    if n_points < _MIN_FREQ_POINTS:
+        raise ValidationError(
+            f"Number of points must be at least {_MIN_FREQ_POINTS} (got {n_points})"
+        )
 
-    if n_points > 100000:
-        raise ValidationError(f"Number of points must be at most 100000 (got {n_points})")
+    if n_points > _MAX_FREQ_POINTS:
+        raise ValidationError(
+            f"Number of points must be at most {_MAX_FREQ_POINTS} (got {n_points})"
+        )
 
-    return f_min, f_max, n_points
+    raise ValidationError(f"Frequency range must be finite (got {f_min} to {f_max})")